@@ -10,8 +10,9 @@
     "sequence": -20,
     'category': 'Tutorials/RealStateAccount',
     "data": [
-        # "security/ir.model.access.csv",
-        # "views/estate_property_views.xml",
+        "security/ir.model.access.csv",
+        "data/ir_cron_data.xml",
+        "views/estate_property_views.xml",
     ],
     "installable": True,
     "auto_install": False,
@@ -1 +1,3 @@
 from . import estate_property_inherited  # noqa: F401
+from . import estate_property_invoice_job  # noqa: F401
+from . import estate_property_archive_inherited  # noqa: F401
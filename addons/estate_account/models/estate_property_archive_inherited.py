@@ -0,0 +1,22 @@
+from odoo import fields, models  # type: ignore
+
+
+class InheritedEstatePropertyArchiveModel(models.Model):
+    _inherit = "estate.property.archive"
+
+    invoice_id = fields.Many2one(
+        "account.move",
+        string="Invoice",
+        readonly=True,
+        help="Invoice created by the deferred invoicing of the property"
+    )
+    invoice_job_state = fields.Selection(
+        selection=[
+            ("pending", "Pending"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        string="Invoicing Job",
+        readonly=True,
+        help="State of the invoicing job when the property was archived"
+    )
@@ -1,48 +1,164 @@
-from odoo import models, exceptions, Command  # type: ignore
+from odoo import fields, models, exceptions, Command  # type: ignore
+from odoo.tools import split_every  # type: ignore
+from odoo.addons.state.tools.instrumentation import (  # type: ignore
+    instrumented,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default number of invoices created per account.move multi-create call
+INVOICE_CHUNK_SIZE = 200
+
 
 class InheritedEstatePropertyModel(models.Model):
     _inherit = "estate.property"
 
+    invoice_pending = fields.Boolean(
+        string="Invoice Pending",
+        readonly=True,
+        copy=False,
+        help="The invoice of the sold property is queued for generation"
+    )
+    invoice_job_ids = fields.One2many(
+        "estate.property.invoice.job",
+        "property_id",
+        string="Invoice Jobs",
+        readonly=True,
+    )
+
+    @instrumented
     def action_sold(self):
         """
             Create an invoice for the sold property before marking it as sold.
+
+            When deferred invoicing is enabled (system parameter
+            estate_account.deferred_invoicing), the properties are only
+            queued and a scheduled action creates the invoices later.
         """
-        for record in self:
-            # Validate required fields
-            if not record.selling_price or not record.buyer:
-                raise exceptions.UserError(
-                    "Cannot create invoice: Selling price and buyer are "
-                    "required."
-                )
-
-            # Create invoice
-            invoice = self.env["account.move"].create({
-                "partner_id": record.buyer.id,
-                "move_type": "out_invoice",
-                "invoice_line_ids": [
-                    # Line 1: 6% of the selling price
-                    Command.create({
-                        "name": f"Commission (6%) for property {record.name}",
-                        "quantity": 1.0,
-                        "price_unit": record.selling_price * 0.06,
-                    }),
-                    # Line 2: Fixed administrative fee
-                    Command.create({
-                        "name": "Administrative Fees",
-                        "quantity": 1.0,
-                        "price_unit": 100.00,
-                    }),
-                ],
-            })
-
-            logger.info(
-                "Invoice created for property %s (ID: %s) - Invoice ID: %s",
-                record.name, record.id, invoice.id
-            )
+        self._check_state_transition("sold")
+        if self._is_deferred_invoicing():
+            self._check_invoiceable()
+            res = super().action_sold()
+            self.env["estate.property.invoice.job"]._enqueue(self)
+            return res
+
+        invoices = self._create_sold_invoices()
 
         # Call the original action_sold method from the parent class
-        return super().action_sold()
+        res = super().action_sold()
+        if res or len(self) <= 1:
+            return res
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "type": "success",
+                "message": f"{len(invoices)} invoice(s) created.",
+            },
+        }
+
+    def _is_deferred_invoicing(self):
+        value = self.env["ir.config_parameter"].sudo().get_param(
+            "estate_account.deferred_invoicing", ""
+        )
+        return value.lower() in ("1", "true")
+
+    def _get_archivable_domain(self, cutoff):
+        """Keep properties whose invoice is still queued out of the archive"""
+        return super()._get_archivable_domain(cutoff) + [
+            ("invoice_pending", "=", False),
+        ]
+
+    def _prepare_archive_vals(self):
+        """
+            Copy the invoice and the state of the invoicing job: the job is
+            deleted with the property, and it is the only link between the
+            property and its invoice.
+        """
+        vals = super()._prepare_archive_vals()
+        job = self.invoice_job_ids[:1]
+        vals.update({
+            "invoice_id": job.move_id.id,
+            "invoice_job_state": job.state,
+        })
+        return vals
+
+    def _check_invoiceable(self):
+        """
+            Validate the whole recordset before creating any invoice and
+            report every offending property at once.
+        """
+        invalid = self.filtered(
+            lambda record: not record.selling_price or not record.buyer
+        )
+        if invalid:
+            raise exceptions.UserError(
+                "Cannot create invoice: Selling price and buyer are "
+                "required. Offending properties: "
+                + ", ".join(invalid.mapped("name"))
+            )
+
+    def _prepare_invoice_vals(self):
+        """Return the account.move values for the sold property."""
+        self.ensure_one()
+        return {
+            "partner_id": self.buyer.id,
+            "move_type": "out_invoice",
+            "invoice_line_ids": [
+                # Line 1: 6% of the selling price
+                Command.create({
+                    "name": f"Commission (6%) for property {self.name}",
+                    "quantity": 1.0,
+                    "price_unit": self.selling_price * 0.06,
+                }),
+                # Line 2: Fixed administrative fee
+                Command.create({
+                    "name": "Administrative Fees",
+                    "quantity": 1.0,
+                    "price_unit": 100.00,
+                }),
+            ],
+        }
+
+    def _get_invoice_chunk_size(self):
+        """Chunk size, set by estate_account.invoice_chunk_size"""
+        value = self.env["ir.config_parameter"].sudo().get_param(
+            "estate_account.invoice_chunk_size"
+        )
+        try:
+            return max(int(value), 1) if value else INVOICE_CHUNK_SIZE
+        except ValueError:
+            return INVOICE_CHUNK_SIZE
+
+    @instrumented
+    def _create_sold_invoices(self, chunk_size=None):
+        """
+            Create the invoices of the sold properties in batches.
+
+            All records are validated first, then the invoices are created
+            with one account.move multi-create call per chunk. The cache is
+            flushed and released between chunks so very large selections
+            keep a bounded memory footprint.
+
+            :return: the created account.move records
+        """
+        self._check_invoiceable()
+        chunk_size = chunk_size or self._get_invoice_chunk_size()
+        Move = self.env["account.move"]
+        invoice_ids = []
+        for chunk in split_every(chunk_size, self.ids, self.browse):
+            invoices = Move.create(
+                [record._prepare_invoice_vals() for record in chunk]
+            )
+            invoice_ids.extend(invoices.ids)
+            self.env.flush_all()
+            self.env.invalidate_all()
+
+        invoices = Move.browse(invoice_ids)
+        logger.info(
+            "%s invoice(s) created for %s sold property(ies)",
+            len(invoices), len(self)
+        )
+        logger.debug("Invoice IDs: %s", invoices.ids)
+        return invoices
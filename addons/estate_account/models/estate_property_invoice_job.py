@@ -0,0 +1,242 @@
+"""
+Estate Property Invoice Job Model
+================================
+
+This module defines the queue used by the deferred invoicing mode of
+estate_account. When the mode is enabled, selling a property only records a
+lightweight job row; a scheduled action then drains the queue in batches
+and creates the invoices outside of the HTTP request.
+
+Key Features:
+- One job per property (idempotent enqueueing)
+- Batched invoice creation with per-job fallback on errors
+- Bounded retries with exponential backoff, the last error kept for
+  diagnosis
+- Single scheduled action re-triggering itself while ready jobs are left;
+  jobs claimed with FOR UPDATE SKIP LOCKED, so a manual run never
+  processes a job twice
+
+Technical Details:
+- Model Name: estate.property.invoice.job
+- Table Name: estate_property_invoice_job
+- Dependencies: estate.property, account.move
+"""
+
+from odoo import api, fields, models  # type: ignore
+from datetime import timedelta
+from odoo.addons.state.tools.instrumentation import (  # type: ignore
+    instrumented,
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Default number of jobs processed per batch by the scheduled action
+JOB_BATCH_SIZE = 100
+# Number of batches processed before the cron reschedules itself
+JOB_MAX_BATCHES = 10
+# Number of failed attempts before a job is left in 'failed' state
+JOB_MAX_ATTEMPTS = 3
+# Delay before the first retry of a failed job, doubled at each attempt
+JOB_RETRY_DELAY = timedelta(minutes=5)
+
+
+class EstatePropertyInvoiceJob(models.Model):
+    """
+    Estate Property Invoice Job Model
+
+    Queued invoice generation request for a sold property. Jobs are unique
+    per property so enqueueing the same property twice has no effect.
+
+    Key Fields:
+    - property_id: Sold property to invoice
+    - state: Job progress (pending/done/failed)
+    - attempts: Number of failed processing attempts
+    - next_attempt: Time before which a failed job is not retried
+    - move_id: Invoice created by the job
+    """
+
+    _name = "estate.property.invoice.job"
+    _description = "Real Estate Invoice Job"
+    _order = "id"
+
+    property_id = fields.Many2one(
+        "estate.property",
+        required=True,
+        ondelete="cascade",
+        index=True,
+        help="Sold property to invoice"
+    )
+    state = fields.Selection(
+        selection=[
+            ("pending", "Pending"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+        ],
+        required=True,
+        default="pending",
+        index=True,
+        help="Progress of the invoice generation"
+    )
+    attempts = fields.Integer(
+        default=0,
+        help="Number of failed processing attempts"
+    )
+    next_attempt = fields.Datetime(
+        help="A failed job is not retried before this time"
+    )
+    last_error = fields.Text(
+        help="Error raised by the last failed attempt"
+    )
+    move_id = fields.Many2one(
+        "account.move",
+        readonly=True,
+        help="Invoice created for the property"
+    )
+
+    _sql_constraints = [
+        (
+            "property_unique",
+            "UNIQUE(property_id)",
+            "A property can only be queued for invoicing once."
+        )
+    ]
+
+    @api.model
+    def _enqueue(self, properties):
+        """
+        Queue the given properties for invoicing and flag them as pending.
+        Properties already queued are left untouched, failed jobs are
+        re-armed.
+        """
+        existing = self.search([("property_id", "in", properties.ids)])
+        existing.filtered(lambda job: job.state == "failed").write({
+            "state": "pending",
+            "attempts": 0,
+            "next_attempt": False,
+        })
+        new_properties = properties - existing.property_id
+        jobs = self.create([
+            {"property_id": record.id} for record in new_properties
+        ])
+        pending = (existing + jobs).filtered(
+            lambda job: job.state == "pending"
+        )
+        pending.property_id.write({"invoice_pending": True})
+        return jobs
+
+    def _get_param_int(self, key, default):
+        value = self.env["ir.config_parameter"].sudo().get_param(key)
+        try:
+            return max(int(value), 1) if value else default
+        except ValueError:
+            return default
+
+    def _commit(self):
+        if not self.env.registry.in_test_mode():
+            self.env.cr.commit()
+
+    @api.model
+    @instrumented
+    def _cron_process_jobs(self, batch_size=None, max_batches=None):
+        """
+        Drain the queue in batches, committing after each one. The cron
+        is triggered again when ready jobs are left after max_batches, or
+        when the next failed job becomes due.
+        """
+        batch_size = batch_size or self._get_param_int(
+            "estate_account.invoice_job_batch_size", JOB_BATCH_SIZE
+        )
+        max_batches = max_batches or JOB_MAX_BATCHES
+        for _batch in range(max_batches):
+            jobs = self._claim_jobs(batch_size)
+            if not jobs:
+                break
+            jobs._process()
+            self._commit()
+        else:
+            self._trigger_cron()
+            return
+        self.env.cr.execute(f"""
+            SELECT MIN(next_attempt) FROM {self._table}
+             WHERE state = 'pending' AND next_attempt > %s
+        """, (fields.Datetime.now(),))
+        next_attempt = self.env.cr.fetchone()[0]
+        if next_attempt:
+            self._trigger_cron(at=next_attempt)
+
+    def _claim_jobs(self, limit):
+        """
+        Locks and returns up to limit pending jobs that are due, skipping
+        the ones locked by another run (e.g. a manual one). The locks are
+        released by the commit following their processing.
+        """
+        self.flush_model()
+        self.env.cr.execute(f"""
+            SELECT id FROM {self._table}
+             WHERE state = 'pending'
+               AND (next_attempt IS NULL OR next_attempt <= %s)
+          ORDER BY id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+        """, (fields.Datetime.now(), limit))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _trigger_cron(self, at=None):
+        self.env.ref("estate_account.ir_cron_process_invoice_jobs")._trigger(
+            at=at
+        )
+
+    def _process(self):
+        """
+        Create the invoices of the jobs. The batch is tried as a whole
+        first; on error every job is retried on its own so a single bad
+        property does not block the others.
+        """
+        jobs = self.filtered(lambda job: not job.move_id)
+        (self - jobs).write({"state": "done"})
+        if not jobs:
+            return
+        try:
+            with self.env.cr.savepoint():
+                jobs._create_invoices()
+        except Exception:
+            logger.warning(
+                "Batch invoicing of %s job(s) failed, retrying one by one",
+                len(jobs), exc_info=True
+            )
+            for job in jobs:
+                try:
+                    with self.env.cr.savepoint():
+                        job._create_invoices()
+                except Exception as error:
+                    job._mark_failed(error)
+
+    def _create_invoices(self):
+        properties = self.property_id
+        invoices = properties._create_sold_invoices()
+        moves_by_property = dict(zip(properties.ids, invoices.ids))
+        for job in self:
+            job.write({
+                "state": "done",
+                "move_id": moves_by_property[job.property_id.id],
+                "last_error": False,
+            })
+        properties.write({"invoice_pending": False})
+
+    def _mark_failed(self, error):
+        self.ensure_one()
+        attempts = self.attempts + 1
+        self.write({
+            "attempts": attempts,
+            "last_error": str(error),
+            "state": "failed" if attempts >= JOB_MAX_ATTEMPTS else "pending",
+            "next_attempt": (
+                fields.Datetime.now()
+                + JOB_RETRY_DELAY * 2 ** (attempts - 1)
+            ),
+        })
+        logger.warning(
+            "Invoice job %s for property %s failed (attempt %s): %s",
+            self.id, self.property_id.id, attempts, error
+        )
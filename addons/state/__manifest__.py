@@ -4,18 +4,33 @@
     "author": "Jorge Alberto Quiroz Sierra",
     "depends": [
         "base",
+        "bus",
     ],
     "sequence": -10,
     'category': 'Tutorials/RealState',
     "data": [
         "security/ir.model.access.csv",
+        "data/ir_cron_data.xml",
         "views/estate_property_views.xml",
         "views/estate_property_offer_views.xml",
         "views/estate_property_type_views.xml",
         "views/estate_property_tag_views.xml",
         "views/res_users_inherited_views.xml",
+        "views/res_partner_inherited_views.xml",
+        "views/estate_performance_stat_views.xml",
+        "views/estate_property_export_views.xml",
+        "views/estate_property_report_views.xml",
+        "views/estate_property_archive_views.xml",
         "views/estate_menus.xml",
     ],
+    "external_dependencies": {
+        "python": ["numpy"],
+    },
+    "assets": {
+        "web.assets_backend": [
+            "state/static/src/**/*",
+        ],
+    },
     "installable": True,
     "auto_install": False,
     "application": True,
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from . import export  # noqa: F401
+from . import bulk_import  # noqa: F401
+from . import sync  # noqa: F401
+from . import matching  # noqa: F401
@@ -0,0 +1,36 @@
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+
+
+class EstatePropertyBulkImport(http.Controller):
+    """
+    Controller exposing the bulk import of properties (and their offers)
+    from external listing feeds. The work is done by the
+    estate.property.import service model.
+    """
+
+    @http.route(
+        ['/state/api/properties/import'],
+        type='json',
+        auth='user',
+        methods=['POST'],
+    )
+    def import_properties(self, rows=None, csv_data=None):
+        """
+        Upserts properties keyed on their external reference.
+
+        Route: /state/api/properties/import
+        Type: JSON-RPC request
+        Authentication: User
+
+        Params:
+            rows (list): Property rows as JSON objects
+            csv_data (str): Alternatively, a CSV document with a header line
+
+        Returns:
+            dict: Import report (created, updated, offers and per-row errors)
+        """
+        importer = request.env['estate.property.import']
+        if csv_data:
+            return importer.import_csv(csv_data)
+        return importer.import_rows(rows or [])
@@ -0,0 +1,120 @@
+from odoo import api, http  # type: ignore
+from odoo.http import content_disposition, request  # type: ignore
+from odoo.modules.registry import Registry  # type: ignore
+from odoo.addons.state.models.estate_property import (  # type: ignore
+    EXPORT_HEADER,
+)
+import csv
+import io
+import os
+import tempfile
+
+import xlsxwriter  # type: ignore
+
+# Size of the blocks written to the HTTP response
+STREAM_BLOCK_SIZE = 64 * 1024
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv;charset=utf-8', 'csv'),
+    'xlsx': (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'xlsx',
+    ),
+}
+
+
+def _iter_rows(dbname, uid, context, domain):
+    """
+    Yields the export rows using a dedicated cursor: the response body is
+    consumed after the request cursor has been closed.
+    """
+    with Registry(dbname).cursor() as cr:
+        env = api.Environment(cr, uid, context)
+        yield from env['estate.property']._iter_export_rows(domain)
+
+
+def _stream_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_HEADER)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= STREAM_BLOCK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _stream_xlsx(rows):
+    """
+    Writes the rows to a temporary workbook in constant-memory mode (rows
+    are flushed to disk as they are written), then streams the file.
+    """
+    fd, path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet('Properties')
+        worksheet.write_row(0, 0, EXPORT_HEADER)
+        for row_index, row in enumerate(rows, start=1):
+            worksheet.write_row(row_index, 0, [
+                str(value) if hasattr(value, 'isoformat') else value
+                for value in row
+            ])
+        workbook.close()
+        with open(path, 'rb') as file:
+            while True:
+                block = file.read(STREAM_BLOCK_SIZE)
+                if not block:
+                    break
+                yield block
+    finally:
+        os.unlink(path)
+
+
+class EstatePropertyExport(http.Controller):
+    """
+    Controller streaming the export of properties with their offers and
+    tags, configured by the estate.property.export wizard.
+    """
+
+    @http.route(
+        ['/state/export/properties/<int:wizard_id>'],
+        type='http',
+        auth='user',
+    )
+    def export_properties(self, wizard_id):
+        """
+        Streams the properties selected in the wizard as CSV or XLSX.
+
+        Route: /state/export/properties/<wizard_id>
+        Type: HTTP GET request
+        Authentication: User
+
+        Returns:
+            http.Response: Streamed file download
+        """
+        wizard = request.env['estate.property.export'].browse(
+            wizard_id
+        ).exists()
+        if not wizard:
+            raise request.not_found()
+
+        mimetype, extension = EXPORT_FORMATS[wizard.file_format]
+        rows = _iter_rows(
+            request.env.cr.dbname,
+            request.env.uid,
+            dict(request.env.context),
+            wizard._get_export_domain(),
+        )
+        stream = (
+            _stream_xlsx(rows) if wizard.file_format == 'xlsx'
+            else _stream_csv(rows)
+        )
+        return request.make_response(stream, headers=[
+            ('Content-Type', mimetype),
+            ('Content-Disposition', content_disposition(
+                f'properties.{extension}'
+            )),
+        ])
@@ -0,0 +1,50 @@
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+
+
+class EstatePropertyMatching(http.Controller):
+    """
+    Controller exposing the buyer-to-property matching in batch. The work
+    is done by the estate.property.matching service model.
+    """
+
+    @http.route(
+        ['/state/api/matching'],
+        type='json',
+        auth='user',
+        methods=['POST'],
+    )
+    def match(self, partner_ids=None, limit=10):
+        """
+        Returns the available properties best matching each buyer.
+
+        Route: /state/api/matching
+        Type: JSON-RPC request
+        Authentication: User
+
+        Params:
+            partner_ids (list): Ids of the buyers (res.partner)
+            limit (int): Number of properties per buyer (100 at most)
+
+        Returns:
+            list: [{'partner_id': id, 'matches': [{'property_id': id,
+                'score': cosine similarity}]}], best matches first
+        """
+        partners = request.env['res.partner'].browse(
+            partner_ids or []
+        ).exists()
+        partners.check_access_rights('read')
+        partners.check_access_rule('read')
+        matches = request.env['estate.property.matching'].match(
+            partners, limit=min(max(int(limit), 1), 100)
+        )
+        return [
+            {
+                'partner_id': partner_id,
+                'matches': [
+                    {'property_id': property_id, 'score': score}
+                    for property_id, score in result
+                ],
+            }
+            for partner_id, result in matches.items()
+        ]
@@ -0,0 +1,37 @@
+from odoo import http  # type: ignore
+from odoo.http import request  # type: ignore
+
+
+class EstateSync(http.Controller):
+    """
+    Controller exposing the delta synchronization of the mobile agents'
+    app. The work is done by the estate.sync.tombstone model.
+    """
+
+    @http.route(
+        ['/state/sync/<string:resource>'],
+        type='json',
+        auth='user',
+        methods=['POST'],
+    )
+    def sync(self, resource, token=None, limit=None):
+        """
+        Returns the records of resource changed since token.
+
+        Route: /state/sync/<resource> ('properties' or 'offers')
+        Type: JSON-RPC request
+        Authentication: User
+
+        Params:
+            token (str): Token returned by the previous call, empty for a
+                full synchronization
+            limit (int): Page size (500 by default, 5000 at most)
+
+        Returns:
+            dict: records (compact values), deleted (ids), token (to send
+                on the next call), has_more (call again immediately) and
+                reset (the token was too old, drop the local copy)
+        """
+        return request.env['estate.sync.tombstone'].get_changes(
+            resource, token=token, limit=limit
+        )
@@ -3,3 +3,12 @@ from . import estate_property_type  # noqa: F401
 from . import estate_property_tag  # noqa: F401
 from . import estate_property_offer  # noqa: F401
 from . import res_users  # noqa: F401
+from . import estate_performance_stat  # noqa: F401
+from . import estate_property_import  # noqa: F401
+from . import estate_property_archive  # noqa: F401
+# The report view reads the archive tables: they must exist first
+from . import estate_property_report  # noqa: F401
+from . import estate_sync  # noqa: F401
+from . import estate_property_valuation  # noqa: F401
+from . import res_partner  # noqa: F401
+from . import estate_property_matching  # noqa: F401
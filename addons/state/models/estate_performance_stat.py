@@ -0,0 +1,82 @@
+"""
+Estate Performance Statistics Model
+==================================
+
+This module defines a transient model exposing the in-memory statistics
+collected by the @instrumented decorator (see state/tools/instrumentation).
+
+Key Features:
+- One line per instrumented method
+- Average and maximum wall time, average query count
+- Reset of the collected statistics
+
+Technical Details:
+- Model Name: estate.performance.stat
+- Transient: rows are rebuilt from the worker memory on every opening
+"""
+
+from odoo import api, fields, models  # type: ignore
+from ..tools import instrumentation
+
+
+class EstatePerformanceStat(models.TransientModel):
+    """
+    Estate Performance Statistics Model
+
+    Snapshot of the aggregated measurements of the current worker.
+
+    Key Fields:
+    - name: Model and method measured
+    - calls: Number of sampled calls
+    - avg_time_ms / max_time_ms: Wall time per call
+    - avg_queries: SQL queries per call
+    """
+
+    _name = "estate.performance.stat"
+    _description = "Real Estate Performance Statistics"
+    _order = "total_time_ms desc"
+
+    name = fields.Char(string="Method", readonly=True)
+    calls = fields.Integer(readonly=True)
+    records = fields.Integer(
+        readonly=True,
+        help="Total number of records processed by the sampled calls"
+    )
+    total_time_ms = fields.Float(string="Total Time (ms)", readonly=True)
+    avg_time_ms = fields.Float(string="Average Time (ms)", readonly=True)
+    max_time_ms = fields.Float(string="Max Time (ms)", readonly=True)
+    queries = fields.Integer(readonly=True)
+    avg_queries = fields.Float(string="Average Queries", readonly=True)
+
+    @api.model
+    def action_open_stats(self):
+        """Rebuilds the snapshot from memory and opens it."""
+        self.search([("create_uid", "=", self.env.uid)]).unlink()
+        vals_list = []
+        for key, stat in instrumentation.get_stats(self.env.cr.dbname).items():
+            calls = stat['calls'] or 1
+            vals_list.append({
+                'name': key,
+                'calls': stat['calls'],
+                'records': stat['records'],
+                'total_time_ms': stat['total_time'] * 1000,
+                'avg_time_ms': stat['total_time'] * 1000 / calls,
+                'max_time_ms': stat['max_time'] * 1000,
+                'queries': stat['queries'],
+                'avg_queries': stat['queries'] / calls,
+            })
+        self.create(vals_list)
+        return {
+            'type': 'ir.actions.act_window',
+            'name': "Performance Statistics",
+            'res_model': self._name,
+            'view_mode': 'tree',
+            'domain': [('create_uid', '=', self.env.uid)],
+            'target': 'current',
+        }
+
+    @api.model
+    def action_reset_stats(self):
+        """Clears the statistics collected by the current worker."""
+        instrumentation.reset_stats(self.env.cr.dbname)
+        return self.action_open_stats()
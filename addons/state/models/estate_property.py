@@ -14,6 +14,7 @@ Key Features:
 sold/canceled)
 - Relationship management (buyers, salespeople, property types)
 - Automated calculations (total area, best price)
+- Suggested price from the valuation engine (estimated_price)
 - Garden and amenities tracking
 
 Technical Details:
@@ -22,8 +23,32 @@ Technical Details:
 - Dependencies: res.users, res.partner, estate.property.type
 """
 
-from odoo import api, fields, models, exceptions  # type: ignore
+from odoo import api, fields, models, exceptions, tools  # type: ignore
+from odoo import Command  # type: ignore
+from odoo.osv import expression  # type: ignore
+from ..tools.instrumentation import instrumented
 from datetime import timedelta
+# Number of properties loaded per chunk by the streaming export
+EXPORT_CHUNK_SIZE = 1000
+
+EXPORT_HEADER = [
+    'Property ID', 'Name', 'Postcode', 'Property Type', 'State',
+    'Salesperson', 'Expected Price', 'Selling Price', 'Best Offer', 'Tags',
+    'Offer Partner', 'Offer Price', 'Offer Status', 'Offer Deadline',
+]
+
+# Columns of the full-text document
+SEARCH_COLUMNS = ('name', 'description', 'postcode')
+FULLTEXT_DOCUMENT = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || "
+    "coalesce(description, '') || ' ' || coalesce(postcode, ''))"
+)
+
+# Target state: (states it cannot be reached from, error message)
+STATE_TRANSITIONS = {
+    "canceled": (("sold",), "A sold property cannot be canceled."),
+    "sold": (("canceled",), "A canceled property cannot be set as sold."),
+}
 
 
 class EstateProperty(models.Model):
@@ -36,7 +61,7 @@ class EstateProperty(models.Model):
     Key Fields:
     - Basic Info: name, description, postcode
     - Specifications: bedrooms, living_area, facades
-    - Pricing: expected_price, selling_price
+    - Pricing: expected_price, selling_price, estimated_price
     - Amenities: garage, garden, garden_area, garden_orientation
     - Status: active, state
     - Relationships: property_type_id, salesperson, buyer, tag_ids, offer_ids
@@ -57,14 +82,24 @@ class EstateProperty(models.Model):
     name = fields.Char(
         string='Name',
         required=True,
+        index='trigram',
         help="Property title or identifier"
     )
     description = fields.Text(
         string='Description',
+        index='trigram',
         help="Detailed description of the property"
     )
+    external_ref = fields.Char(
+        string='External Reference',
+        copy=False,
+        index=True,
+        help="Reference of the listing in external feeds, used as the key "
+             "of the bulk import"
+    )
     postcode = fields.Char(
         string='Postcode',
+        index='trigram',
         help="Postal code where the property is located"
     )
 
@@ -88,6 +123,19 @@ class EstateProperty(models.Model):
         copy=False,
         help="Final selling price of the property"
     )
+    estimated_price = fields.Float(
+        string='Estimated Price',
+        readonly=True,
+        copy=False,
+        help="Price suggested by the valuation model fitted on the sold "
+             "properties"
+    )
+    date_sold = fields.Date(
+        string='Sold On',
+        readonly=True,
+        copy=False,
+        help="Date on which the property was marked as sold"
+    )
 
     # Property Specifications
     bedrooms = fields.Integer(
@@ -97,6 +145,7 @@ class EstateProperty(models.Model):
     )
     living_area = fields.Integer(
         string='Living Area (sqm)',
+        index=True,
         help="Total living area in square meters"
     )
     facades = fields.Integer(
@@ -146,6 +195,7 @@ class EstateProperty(models.Model):
         required=True,
         default='new',
         copy=False,
+        index=True,
         help="Current state of the property in the sales pipeline"
     )
 
@@ -153,6 +203,8 @@ class EstateProperty(models.Model):
     property_type_id = fields.Many2one(
         'estate.property.type',
         string='Property Type',
+        index=True,
+        group_expand='_read_group_property_type_ids',
         help="Category or type of the property"
     )
     salesperson = fields.Many2one(
@@ -160,6 +212,7 @@ class EstateProperty(models.Model):
         string='Salesperson',
         default=lambda self: self.env.user,
         # Automatically set to current user
+        index=True,
         help="User responsible for selling the property"
     )
     buyer = fields.Many2one(
@@ -179,6 +232,12 @@ class EstateProperty(models.Model):
         string='Offers',
         help="Offers made for this property"
     )
+    fulltext = fields.Char(
+        string='Full Text',
+        compute='_compute_fulltext',
+        search='_search_fulltext',
+        help="Full-text search over name, description and postcode"
+    )
     total_area = fields.Integer(
         string='Total Area (sqm)',
         compute='_compute_total_area',
@@ -187,10 +246,16 @@ class EstateProperty(models.Model):
     best_price = fields.Float(
         string='Best Offer',
         compute='_compute_best_price',
+        store=True,
         help="Highest offer received for the property"
     )
 
     _sql_constraints = [
+        (
+            'external_ref_unique',
+            'UNIQUE(external_ref)',
+            'The external reference must be unique.'
+        ),
         (
             'check_expected_price_positive',
             'CHECK(expected_price > 0)',
@@ -203,19 +268,141 @@ class EstateProperty(models.Model):
         )
     ]
 
+    def init(self):
+        """
+        Creates the partial indexes backing the pipeline queries: the
+        default "Available" listing (ordered by id desc), the salesperson
+        property lists restricted to active, unsold properties and the
+        (write_date, id) keyset of the delta sync, and the GIN index of the
+        full-text document used by the ranked search. The ilike searches on
+        name, description and postcode use the trigram indexes the ORM
+        creates for their index='trigram' fields.
+        """
+        tools.create_index(
+            self._cr,
+            'estate_property_available_index',
+            self._table,
+            ['id DESC'],
+            where="active AND state IN ('new', 'offer_received')",
+        )
+        tools.create_index(
+            self._cr,
+            'estate_property_pipeline_index',
+            self._table,
+            ['salesperson', 'state'],
+            where="active AND state NOT IN ('sold', 'canceled')",
+        )
+        tools.create_index(
+            self._cr,
+            'estate_property_write_date_index',
+            self._table,
+            ['write_date', 'id'],
+        )
+        tools.create_index(
+            self._cr,
+            'estate_property_fulltext_index',
+            self._table,
+            [FULLTEXT_DOCUMENT],
+            method='gin',
+        )
+
+    @api.model
+    def search_fetch(self, domain, field_names, offset=0, limit=None,
+                     order=None):
+        """
+        Keeps the ranking of the buyer matching action: when the context
+        holds estate_match_ranking (property ids, best match first) and no
+        explicit order is requested, the records come in that order.
+        """
+        records = super().search_fetch(
+            domain, field_names, offset=offset, limit=limit, order=order
+        )
+        ranking = self.env.context.get('estate_match_ranking')
+        if ranking and not order:
+            rank = {property_id: index
+                    for index, property_id in enumerate(ranking)}
+            records = records.sorted(
+                lambda record: rank.get(record.id, len(rank))
+            )
+        return records
+
+    def _search_fulltext(self, operator, value):
+        """Full-text search over name, description and postcode."""
+        if operator not in ('ilike', '=') or not value:
+            raise exceptions.UserError("Unsupported search operation.")
+        return [('id', 'inselect', (
+            f"SELECT id FROM {self._table} "
+            f"WHERE {FULLTEXT_DOCUMENT} @@ plainto_tsquery('simple', %s)",
+            [value],
+        ))]
+
+    @api.model
+    def search_fulltext(self, query, limit=80):
+        """
+        Ranked full-text search over name, description and postcode.
+
+        :return: list of {'id', 'name', 'rank'} ordered by relevance
+        """
+        if not query:
+            return []
+        self.flush_model(list(SEARCH_COLUMNS) + ['active'])
+        self.env.cr.execute(f"""
+            SELECT id, name,
+                   ts_rank({FULLTEXT_DOCUMENT}, q) AS rank
+              FROM {self._table}, plainto_tsquery('simple', %s) q
+             WHERE active AND {FULLTEXT_DOCUMENT} @@ q
+          ORDER BY rank DESC, id DESC
+             LIMIT %s
+        """, (query, limit))
+        rows = self.env.cr.dictfetchall()
+        # Apply access rights and record rules on the ranked result
+        self.check_access_rights('read')
+        allowed = self.browse([row['id'] for row in rows])
+        allowed = set(allowed._filter_access_rules('read').ids)
+        return [row for row in rows if row['id'] in allowed]
+
     @api.depends('living_area', 'garden_area')
     def _compute_total_area(self):
         """Calculates the total area by summing living and garden areas."""
         for record in self:
             record.total_area = record.living_area + record.garden_area
 
-    @api.depends('offer_ids')
+    def _compute_fulltext(self):
+        self.fulltext = False
+
+    @api.depends('offer_ids.price')
+    @instrumented
     def _compute_best_price(self):
+        """
+        Computes the highest offer price for each property.
+
+        Persisted properties are resolved with a single grouped MAX(price)
+        query over estate_property_offer; records that only exist in memory
+        (e.g. during onchange) fall back to their cached offers.
+        """
+        stored = self.filtered('id')
+        best_prices = {}
+        if stored:
+            best_prices = dict(self.env['estate.property.offer']._read_group(
+                [('property_id', 'in', stored.ids)],
+                ['property_id'],
+                ['price:max'],
+            ))
         for record in self:
-            if record.offer_ids:
-                record.best_price = max(record.offer_ids.mapped('price'))
+            if record.id:
+                record.best_price = best_prices.get(record, 0.0) or 0.0
             else:
-                record.best_price = 0.0
+                record.best_price = max(
+                    record.offer_ids.mapped('price'), default=0.0
+                )
+
+    @api.model
+    def _read_group_property_type_ids(self, property_types, domain, order):
+        """
+        Shows every property type as a kanban column so folded types keep
+        their column; their cards are not loaded until the column is opened.
+        """
+        return property_types.search([], order=order)
 
     @api.onchange("garden")
     def _onchange_garden(self):
@@ -226,27 +413,175 @@ class EstateProperty(models.Model):
             self.garden_area = 0
             self.garden_orientation = ""
 
+    @instrumented
     def action_cancel(self):
-        for record in self:
-            if record.state == "sold":
-                raise exceptions.UserError(
-                    "A sold property cannot be canceled."
-                )
-            record.state = "canceled"
+        return self._apply_state_transition("canceled")
 
+    @instrumented
     def action_sold(self):
-        for record in self:
-            if record.state == "canceled":
-                raise exceptions.UserError(
-                    "A canceled property cannot be set as sold."
-                )
-            record.state = "sold"
+        return self._apply_state_transition("sold")
 
-    def unlink(self):
-        for record in self:
-            if record.state not in ['new', 'canceled']:
-                raise exceptions.UserError(
-                    "You cannot delete a property that is not in 'New' or "
-                    "'Canceled' state."
-                )
-        return super().unlink()
+    def action_estimate_price(self):
+        """Fills estimated_price with the valuation model."""
+        self.env['estate.property.valuation'].estimate(self)
+
+    def _check_state_transition(self, target_state):
+        """
+        Validates the transition of the whole recordset to target_state and
+        raises a single UserError listing every offending property.
+        """
+        blocked_states, message = STATE_TRANSITIONS[target_state]
+        offending = self.filtered(
+            lambda record: record.state in blocked_states
+        )
+        if offending:
+            raise exceptions.UserError(
+                f"{message} Offending properties: "
+                + ", ".join(offending.mapped("name"))
+            )
+
+    def _apply_state_transition(self, target_state):
+        """
+        Moves the recordset to target_state with a single write on the
+        records that are not already in that state.
+        """
+        self._check_state_transition(target_state)
+        to_write = self.filtered(lambda record: record.state != target_state)
+        if to_write:
+            to_write.write(self._get_state_transition_values(target_state))
+
+    def _get_state_transition_values(self, target_state):
+        """Values written on the properties entering target_state."""
+        values = {"state": target_state}
+        if target_state == "sold":
+            values["date_sold"] = fields.Date.today()
+        return values
+
+    @api.ondelete(at_uninstall=False)
+    def _unlink_except_not_new_or_canceled(self):
+        """
+        Prevents the deletion of properties that are not in 'New' or
+        'Canceled' state, checking the whole batch with one query.
+        Finished properties moved to the archive by the (superuser) archiving
+        job are let through.
+        """
+        if self.env.su and self.env.context.get('estate_archiving'):
+            return
+        if self.with_context(active_test=False).search_count([
+            ('id', 'in', self.ids),
+            ('state', 'not in', ['new', 'canceled']),
+        ], limit=1):
+            raise exceptions.UserError(
+                "You cannot delete a property that is not in 'New' or "
+                "'Canceled' state."
+            )
+
+    @api.ondelete(at_uninstall=False)
+    def _unlink_record_sync_tombstones(self):
+        """
+        Records the deletions for the delta sync of the mobile app. The
+        offers are deleted by the ON DELETE CASCADE of their foreign key,
+        without loading them: their tombstones are inserted with one query.
+        """
+        Tombstone = self.env['estate.sync.tombstone']
+        Tombstone._record(self)
+        Tombstone._record_cascade(
+            'estate.property.offer', 'property_id', self.ids
+        )
+
+    def _iter_export_rows(self, domain, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Yields the export rows of the properties matching domain: one row
+        per offer, or a single row for properties without offers.
+
+        Properties are loaded in chunks of chunk_size with keyset
+        pagination on id; related tags and offers are prefetched per chunk
+        and the cache is released afterwards, so memory use does not grow
+        with the size of the export.
+        """
+        state_labels = dict(self._fields['state'].selection)
+        status_labels = dict(
+            self.env['estate.property.offer']._fields['status'].selection
+        )
+        last_id = 0
+        while True:
+            records = self.search(
+                expression.AND([domain, [('id', '>', last_id)]]),
+                order='id',
+                limit=chunk_size,
+            )
+            if not records:
+                return
+            for record in records:
+                values = [
+                    record.id,
+                    record.name,
+                    record.postcode or '',
+                    record.property_type_id.name or '',
+                    state_labels.get(record.state, ''),
+                    record.salesperson.name or '',
+                    record.expected_price,
+                    record.selling_price,
+                    record.best_price,
+                    ', '.join(record.tag_ids.mapped('name')),
+                ]
+                if not record.offer_ids:
+                    yield values + ['', '', '', '']
+                for offer in record.offer_ids:
+                    yield values + [
+                        offer.partner_id.name or '',
+                        offer.price,
+                        status_labels.get(offer.status, ''),
+                        offer.date_deadline or '',
+                    ]
+            last_id = records[-1].id
+            self.env.invalidate_all()
+
+    def _get_archivable_domain(self, cutoff):
+        """
+        Domain of the finished properties that may be moved to the archive:
+        sold or canceled and left untouched since cutoff.
+        """
+        return [
+            ('state', 'in', ['sold', 'canceled']),
+            ('write_date', '<', cutoff),
+        ]
+
+    def _prepare_archive_vals(self):
+        """Values of the estate.property.archive copy of the property."""
+        self.ensure_one()
+        return {
+            'original_id': self.id,
+            'name': self.name,
+            'external_ref': self.external_ref,
+            'description': self.description,
+            'postcode': self.postcode,
+            'state': self.state,
+            'expected_price': self.expected_price,
+            'selling_price': self.selling_price,
+            'best_price': self.best_price,
+            'bedrooms': self.bedrooms,
+            'living_area': self.living_area,
+            'facades': self.facades,
+            'garage': self.garage,
+            'garden': self.garden,
+            'garden_area': self.garden_area,
+            'garden_orientation': self.garden_orientation,
+            'property_type_id': self.property_type_id.id,
+            'salesperson': self.salesperson.id,
+            'buyer': self.buyer.id,
+            'tag_ids': [Command.set(self.tag_ids.ids)],
+            'date_listed': self.create_date,
+            'date_sold': self.date_sold,
+            'offer_ids': [
+                Command.create({
+                    'original_id': offer.id,
+                    'partner_id': offer.partner_id.id,
+                    'price': offer.price,
+                    'status': offer.status,
+                    'validity': offer.validity,
+                    'date_deadline': offer.date_deadline,
+                })
+                for offer in self.offer_ids
+            ],
+        }
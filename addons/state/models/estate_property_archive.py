@@ -0,0 +1,195 @@
+"""
+Estate Property Archive Models
+=============================
+
+This module defines the archive of finished real estate properties. Sold
+and canceled properties older than a configurable age are moved, with
+their offers, out of the hot estate_property and estate_property_offer
+tables into dedicated read-only tables, keeping the active pipeline small.
+
+Key Features:
+- Batched archiving by a scheduled action
+- Age threshold configurable with the state.archive_after_days system
+  parameter (days since the last change of the property)
+- Read-only list, form and search views on the archived records
+
+Technical Details:
+- Model Names: estate.property.archive, estate.property.offer.archive
+- Table Names: estate_property_archive, estate_property_offer_archive
+- Dependencies: estate.property, estate.property.offer
+"""
+
+from odoo import api, fields, models  # type: ignore
+from ..tools.instrumentation import instrumented
+from datetime import timedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+ARCHIVE_AGE_PARAM = 'state.archive_after_days'
+DEFAULT_ARCHIVE_AGE = 365
+# Number of properties archived per batch (one transaction each)
+ARCHIVE_BATCH_SIZE = 500
+# Number of batches processed before the cron reschedules itself
+ARCHIVE_MAX_BATCHES = 20
+
+
+class EstatePropertyArchive(models.Model):
+    """
+    Estate Property Archive Model
+
+    Frozen copy of a sold or canceled property.
+
+    Key Fields:
+    - original_id: Id of the property in estate_property
+    - Property details, prices and state at archiving time
+    - offer_ids: Archived offers
+    """
+
+    _name = "estate.property.archive"
+    _description = "Archived Real Estate Property"
+    _order = "date_sold desc, id desc"
+
+    original_id = fields.Integer(
+        string='Original ID', readonly=True, index=True,
+        help="Identifier of the property before archiving"
+    )
+    name = fields.Char(readonly=True)
+    external_ref = fields.Char(
+        string='External Reference', readonly=True, index=True
+    )
+    description = fields.Text(readonly=True)
+    postcode = fields.Char(readonly=True)
+    state = fields.Selection(
+        selection=[
+            ('sold', 'Sold'),
+            ('canceled', 'Canceled'),
+        ],
+        readonly=True,
+    )
+    expected_price = fields.Float(readonly=True)
+    selling_price = fields.Float(readonly=True)
+    best_price = fields.Float(string='Best Offer', readonly=True)
+    bedrooms = fields.Integer(readonly=True)
+    living_area = fields.Integer(string='Living Area (sqm)', readonly=True)
+    facades = fields.Integer(readonly=True)
+    garage = fields.Boolean(readonly=True)
+    garden = fields.Boolean(readonly=True)
+    garden_area = fields.Integer(string='Garden Area (sqm)', readonly=True)
+    garden_orientation = fields.Selection(
+        selection=[
+            ('north', 'North'),
+            ('south', 'South'),
+            ('east', 'East'),
+            ('west', 'West')
+        ],
+        readonly=True,
+    )
+    property_type_id = fields.Many2one(
+        'estate.property.type', string='Property Type', readonly=True,
+        index=True,
+    )
+    salesperson = fields.Many2one('res.users', readonly=True, index=True)
+    buyer = fields.Many2one('res.partner', readonly=True)
+    tag_ids = fields.Many2many(
+        'estate.property.tag',
+        'estate_property_archive_tag_rel',
+        'archive_id',
+        'tag_id',
+        string='Tags',
+        readonly=True,
+    )
+    date_listed = fields.Datetime(string='Listed On', readonly=True)
+    date_sold = fields.Date(string='Sold On', readonly=True)
+    offer_ids = fields.One2many(
+        'estate.property.offer.archive',
+        'property_archive_id',
+        string='Offers',
+        readonly=True,
+    )
+
+    def _get_archive_age(self):
+        value = self.env['ir.config_parameter'].sudo().get_param(
+            ARCHIVE_AGE_PARAM
+        )
+        try:
+            return max(int(value), 0) if value else DEFAULT_ARCHIVE_AGE
+        except ValueError:
+            return DEFAULT_ARCHIVE_AGE
+
+    def _commit(self):
+        if not self.env.registry.in_test_mode():
+            self.env.cr.commit()
+
+    @api.model
+    @instrumented
+    def _cron_archive_properties(self, batch_size=None, max_batches=None):
+        """
+        Archives the finished properties older than the configured age,
+        one committed batch at a time; triggers itself again when
+        properties are left after max_batches.
+        """
+        Property = self.env['estate.property'].sudo().with_context(
+            active_test=False
+        )
+        cutoff = fields.Datetime.now() - timedelta(
+            days=self._get_archive_age()
+        )
+        domain = Property._get_archivable_domain(cutoff)
+        batch_size = batch_size or ARCHIVE_BATCH_SIZE
+        for _batch in range(max_batches or ARCHIVE_MAX_BATCHES):
+            properties = Property.search(domain, order='id',
+                                         limit=batch_size)
+            if not properties:
+                return
+            self.sudo()._archive(properties)
+            self._commit()
+            self.env.invalidate_all()
+        if Property.search_count(domain, limit=1):
+            self.env.ref('state.ir_cron_archive_properties')._trigger()
+
+    @api.model
+    def _archive(self, properties):
+        """
+        Copies the properties and their offers into the archive tables,
+        then deletes them from the hot tables.
+        """
+        archives = self.create([
+            record._prepare_archive_vals() for record in properties
+        ])
+        properties.with_context(estate_archiving=True).unlink()
+        _logger.info("%s property(ies) archived", len(archives))
+        return archives
+
+
+class EstatePropertyOfferArchive(models.Model):
+    """
+    Estate Property Offer Archive Model
+
+    Frozen copy of an offer of an archived property.
+    """
+
+    _name = "estate.property.offer.archive"
+    _description = "Archived Real Estate Property Offer"
+    _order = "price desc"
+
+    property_archive_id = fields.Many2one(
+        'estate.property.archive',
+        required=True,
+        ondelete='cascade',
+        index=True,
+        readonly=True,
+    )
+    original_id = fields.Integer(string='Original ID', readonly=True)
+    partner_id = fields.Many2one('res.partner', readonly=True, index=True)
+    price = fields.Float(readonly=True)
+    status = fields.Selection(
+        selection=[
+            ('accepted', 'Accepted'),
+            ('refused', 'Refused')
+        ],
+        readonly=True,
+    )
+    validity = fields.Integer(readonly=True)
+    date_deadline = fields.Date(readonly=True)
+
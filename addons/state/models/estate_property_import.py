@@ -0,0 +1,331 @@
+"""
+Estate Property Import Model
+===========================
+
+This module defines the engine behind the bulk import API of the real
+estate module. External listing feeds (MLS) are upserted on
+estate.property, keyed on external_ref, together with their offers.
+
+Key Features:
+- Upsert keyed on the external reference of the property
+- Property types and tags resolved by name with one lookup per chunk
+  (missing ones are created in a single multi-create)
+- Multi-create of properties and offers per chunk
+- Idempotent offers: an offer already recorded for the same property,
+  partner and price is skipped, so a feed can be imported again
+- Per-row error reporting: a failing row never aborts the batch
+
+Technical Details:
+- Model Name: estate.property.import
+- Abstract: no table, service model only
+"""
+
+from odoo import api, fields, models, Command  # type: ignore
+from ..tools.instrumentation import instrumented
+import csv
+import io
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Number of rows processed per chunk
+IMPORT_CHUNK_SIZE = 500
+
+# Importable columns and their converters
+IMPORT_FIELDS = {
+    'name': str,
+    'description': str,
+    'postcode': str,
+    'expected_price': float,
+    'bedrooms': int,
+    'living_area': int,
+    'facades': int,
+    'garden_area': int,
+    'garden_orientation': str,
+    'date_availability': fields.Date.to_date,
+}
+IMPORT_BOOLEAN_FIELDS = ('garage', 'garden')
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'y')
+    return bool(value)
+
+
+def _to_names(value):
+    """Accepts a list of names or a comma-separated string."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    return [name.strip() for name in value if name and name.strip()]
+
+
+class EstatePropertyImport(models.AbstractModel):
+    """
+    Estate Property Import Model
+
+    Row format (JSON object or CSV line):
+    - external_ref: Reference of the listing in the feed (required)
+    - name, expected_price: Required when the property is created
+    - description, postcode, bedrooms, living_area, facades, garage,
+      garden, garden_area, garden_orientation, date_availability
+    - property_type: Name of the property type
+    - tags: List of tag names, or comma-separated names
+    - offers: List of {partner_id, price, validity} (JSON only)
+    """
+
+    _name = "estate.property.import"
+    _description = "Real Estate Property Import"
+
+    @api.model
+    def import_csv(self, data, chunk_size=IMPORT_CHUNK_SIZE):
+        """Imports the rows of a CSV document with a header line."""
+        return self.import_rows(
+            list(csv.DictReader(io.StringIO(data))), chunk_size=chunk_size
+        )
+
+    @api.model
+    @instrumented
+    def import_rows(self, rows, chunk_size=IMPORT_CHUNK_SIZE):
+        """
+        Upserts the rows in chunks and returns a report:
+        {'created': int, 'updated': int, 'offers': int,
+         'offers_skipped': int,
+         'errors': [{'row': index, 'external_ref': ref, 'error': message}]}
+        """
+        report = {
+            'created': 0, 'updated': 0, 'offers': 0, 'offers_skipped': 0,
+            'errors': [],
+        }
+        for start in range(0, len(rows), chunk_size):
+            self._import_chunk(rows[start:start + chunk_size], start, report)
+            self.env.flush_all()
+            self.env.invalidate_all()
+        _logger.info(
+            "Property import: %s created, %s updated, %s offers "
+            "(%s skipped), %s errors",
+            report['created'], report['updated'], report['offers'],
+            report['offers_skipped'], len(report['errors'])
+        )
+        return report
+
+    def _import_chunk(self, rows, offset, report):
+        parsed = []
+        seen_refs = set()
+        for index, row in enumerate(rows, start=offset):
+            try:
+                ref, vals, type_name, tag_names, offers = self._parse_row(row)
+                if ref in seen_refs:
+                    raise ValueError("Duplicate external reference in batch")
+                seen_refs.add(ref)
+            except (AttributeError, KeyError, TypeError, ValueError) as error:
+                self._add_error(report, index, row, error)
+                continue
+            parsed.append((index, ref, vals, type_name, tag_names, offers))
+        if not parsed:
+            return
+
+        type_ids = self._resolve_names(
+            'estate.property.type', {item[3] for item in parsed if item[3]}
+        )
+        tag_ids = self._resolve_names(
+            'estate.property.tag',
+            {name for item in parsed for name in item[4]},
+        )
+        existing = {
+            record.external_ref: record
+            for record in self.env['estate.property'].with_context(
+                active_test=False
+            ).search([('external_ref', 'in', list(seen_refs))])
+        }
+
+        to_create, to_update = [], []
+        for index, ref, vals, type_name, tag_names, offers in parsed:
+            unresolved = [name for name in tag_names if name not in tag_ids]
+            if type_name and type_name not in type_ids:
+                unresolved.insert(0, type_name)
+            if unresolved:
+                error = ValueError(
+                    f"Unresolved property type or tag(s): "
+                    f"{', '.join(unresolved)}"
+                )
+                self._add_error(report, index, rows[index - offset], error)
+                continue
+            if type_name:
+                vals['property_type_id'] = type_ids[type_name]
+            if tag_names:
+                vals['tag_ids'] = [
+                    Command.set([tag_ids[name] for name in tag_names])
+                ]
+            if ref in existing:
+                to_update.append((index, existing[ref], vals, offers))
+            else:
+                to_create.append((index, vals, offers))
+
+        offers_by_property = self._create_properties(to_create, rows, offset,
+                                                     report)
+        for index, record, vals, offers in to_update:
+            try:
+                with self.env.cr.savepoint():
+                    record.write(vals)
+            except Exception as error:
+                self._add_error(report, index, rows[index - offset], error)
+                continue
+            report['updated'] += 1
+            if offers:
+                offers_by_property.append((index, record, offers))
+        self._create_offers(offers_by_property, rows, offset, report)
+
+    def _parse_row(self, row):
+        ref = str(row.get('external_ref') or '').strip()
+        if not ref:
+            raise ValueError("Missing external_ref")
+        vals = {'external_ref': ref}
+        for fname, convert in IMPORT_FIELDS.items():
+            value = row.get(fname)
+            if value not in (None, ''):
+                vals[fname] = convert(value)
+        for fname in IMPORT_BOOLEAN_FIELDS:
+            if row.get(fname) not in (None, ''):
+                vals[fname] = _to_bool(row[fname])
+        type_name = str(row.get('property_type') or '').strip()
+        offers = [
+            {
+                'partner_id': int(offer['partner_id']),
+                'price': float(offer['price']),
+                'validity': int(offer.get('validity') or 7),
+            }
+            for offer in row.get('offers') or []
+        ]
+        return ref, vals, type_name, _to_names(row.get('tags')), offers
+
+    def _resolve_names(self, model_name, names):
+        """
+        Returns {name: id} for the given names, creating the missing
+        records with a single multi-create.
+
+        The creation runs in a savepoint: when it fails (typically the
+        UNIQUE(name) constraint hit by a concurrent import) the names are
+        created one by one, and those still failing are left out of the
+        mapping so that only the rows using them are reported as errors.
+        """
+        if not names:
+            return {}
+        Model = self.env[model_name]
+        mapping = {
+            record.name: record.id
+            for record in Model.search([('name', 'in', list(names))])
+        }
+        missing = sorted(names - mapping.keys())
+        if not missing:
+            return mapping
+        try:
+            with self.env.cr.savepoint():
+                records = Model.create([{'name': name} for name in missing])
+        except Exception:
+            records = Model
+            for name in missing:
+                try:
+                    with self.env.cr.savepoint():
+                        records |= Model.create({'name': name})
+                except Exception as error:
+                    _logger.warning("Could not create %s %r: %s",
+                                    model_name, name, error)
+        for record in records:
+            mapping[record.name] = record.id
+        return mapping
+
+    def _create_properties(self, to_create, rows, offset, report):
+        """
+        Creates the new properties with one multi-create; when it fails the
+        rows are created one by one to isolate the faulty ones.
+        Returns the [(index, property, offers)] to import afterwards.
+        """
+        Property = self.env['estate.property']
+        created = []
+        if not to_create:
+            return created
+        try:
+            with self.env.cr.savepoint():
+                records = Property.create([vals for _i, vals, _o in to_create])
+            created = [
+                (index, record, offers)
+                for (index, _vals, offers), record in zip(to_create, records)
+            ]
+        except Exception:
+            for index, vals, offers in to_create:
+                try:
+                    with self.env.cr.savepoint():
+                        record = Property.create(vals)
+                except Exception as error:
+                    self._add_error(report, index, rows[index - offset],
+                                    error)
+                    continue
+                created.append((index, record, offers))
+        report['created'] += len(created)
+        return [item for item in created if item[2]]
+
+    def _create_offers(self, offers_by_property, rows, offset, report):
+        """
+        Creates the offers with one multi-create, sorted by ascending price
+        per property so feeds listing offers in any order are accepted;
+        falls back to one savepoint per property on error.
+
+        Offers are keyed on (property, partner, price): those already
+        recorded, by a previous import or earlier in the same row, are
+        skipped with a single lookup of the existing offers.
+        """
+        Offer = self.env['estate.property.offer']
+        if not offers_by_property:
+            return
+
+        seen = {
+            (offer.property_id.id, offer.partner_id.id, round(offer.price, 2))
+            for offer in Offer.search_fetch(
+                [('property_id', 'in', [
+                    record.id for _index, record, _o in offers_by_property
+                ])],
+                ['property_id', 'partner_id', 'price'],
+            )
+        }
+        pending = []
+        for index, record, offers in offers_by_property:
+            vals_list = []
+            for offer in sorted(offers, key=lambda offer: offer['price']):
+                key = (record.id, offer['partner_id'],
+                       round(offer['price'], 2))
+                if key in seen:
+                    report['offers_skipped'] += 1
+                    continue
+                seen.add(key)
+                vals_list.append(dict(offer, property_id=record.id))
+            if vals_list:
+                pending.append((index, vals_list))
+
+        try:
+            with self.env.cr.savepoint():
+                offers = Offer.create([
+                    vals for _index, vals_list in pending for vals in vals_list
+                ])
+            report['offers'] += len(offers)
+        except Exception:
+            for index, vals_list in pending:
+                try:
+                    with self.env.cr.savepoint():
+                        created = Offer.create(vals_list)
+                except Exception as error:
+                    self._add_error(report, index, rows[index - offset],
+                                    error)
+                    continue
+                report['offers'] += len(created)
+
+    def _add_error(self, report, index, row, error):
+        report['errors'].append({
+            'row': index,
+            'external_ref': (
+                row.get('external_ref') if isinstance(row, dict) else None
+            ),
+            'error': str(error),
+        })
@@ -0,0 +1,452 @@
+"""
+Estate Property Matching Model
+=============================
+
+This module defines the buyer-to-property matching engine of the real
+estate module. Buyers (partners bidding on offers) are matched to the
+available listings from their past offers and their stated criteria.
+
+Key Features:
+- In-memory feature matrix of the available properties, one per database
+  and worker process: price, living and garden areas, bedrooms, property
+  type (one-hot) and tags (multi-hot), z-normalized
+- Incremental updates from the property write_date keyset and the sync
+  tombstones, applied at most every REFRESH_INTERVAL seconds by a single
+  thread while the others keep querying the current index; periodic full
+  rebuild
+- Buyer profiles built from their offers and criteria (res.partner)
+- Cosine top-K with NumPy (argpartition), with the criteria applied as
+  hard filters
+
+Technical Details:
+- Model Name: estate.property.matching
+- Abstract: no table, service model only
+- Dependencies: estate.property, estate.property.offer,
+  estate.sync.tombstone, res.partner, numpy
+"""
+
+from odoo import api, fields, models  # type: ignore
+from ..tools.instrumentation import instrumented
+from .estate_sync import _horizon
+import logging
+import threading
+import time
+import numpy as np  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+# Numeric features: price, living area, garden area, bedrooms
+NUMERIC_WIDTH = 4
+TYPE_WEIGHT = 1.0
+TAG_WEIGHT = 0.5
+# Seconds after which an index is rebuilt (refreshes the normalization)
+REBUILD_INTERVAL = 3600
+# Seconds during which an index is used without looking for changes
+REFRESH_INTERVAL = 5
+# Changed properties above which a rebuild is cheaper than a delta
+MAX_DELTA_SIZE = 20000
+# Partners scored per matrix product
+MATCH_CHUNK_SIZE = 64
+DEFAULT_MATCH_LIMIT = 10
+
+AVAILABLE_STATES = ('new', 'offer_received')
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+class _FeatureIndex:
+    """
+    Feature matrix of the available properties of one database.
+
+    data holds the arrays (ids, types, raw, vectors): property ids, type
+    ids, original numeric features (used by the hard filters) and
+    normalized unit-length feature rows (used by the cosine similarity).
+    Updates build new arrays and replace data at once, so readers holding
+    a previous tuple keep a consistent snapshot without locking.
+    """
+
+    def __init__(self, type_ids, tag_ids, mean, std):
+        self.type_columns = {
+            type_id: NUMERIC_WIDTH + index
+            for index, type_id in enumerate(type_ids)
+        }
+        self.tag_columns = {
+            tag_id: NUMERIC_WIDTH + len(type_ids) + index
+            for index, tag_id in enumerate(tag_ids)
+        }
+        self.width = NUMERIC_WIDTH + len(type_ids) + len(tag_ids)
+        self.mean = mean
+        self.std = std
+        self.data = (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty((0, NUMERIC_WIDTH), dtype=np.float32),
+            np.empty((0, self.width), dtype=np.float32),
+        )
+        self.rows = {}
+        self.cursor = None
+        self.tombstone_cursor = None
+        self.built_at = self.checked_at = time.monotonic()
+
+    def is_fresh(self):
+        """Whether the index was brought up to date recently enough."""
+        return time.monotonic() - self.checked_at < REFRESH_INTERVAL
+
+    def knows(self, type_ids, tag_ids):
+        """Whether every type and tag has a column in the matrix."""
+        return all(
+            type_id in self.type_columns for type_id in type_ids if type_id
+        ) and all(tag_id in self.tag_columns for tag_id in tag_ids)
+
+    def encode(self, numeric, type_weights, tag_weights):
+        """
+        Returns the unit-length feature vectors of numeric rows (NaN for
+        unknown values) and their {type_id: weight} / {tag_id: weight}.
+        """
+        matrix = np.zeros((len(numeric), self.width), dtype=np.float32)
+        if not len(matrix):
+            return matrix
+        matrix[:, :NUMERIC_WIDTH] = np.nan_to_num(
+            (np.asarray(numeric, dtype=np.float32) - self.mean) / self.std
+        )
+        for row, (types, tags) in enumerate(zip(type_weights, tag_weights)):
+            for type_id, weight in types.items():
+                if type_id in self.type_columns:
+                    matrix[row, self.type_columns[type_id]] = (
+                        TYPE_WEIGHT * weight
+                    )
+            for tag_id, weight in tags.items():
+                if tag_id in self.tag_columns:
+                    matrix[row, self.tag_columns[tag_id]] = TAG_WEIGHT * weight
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def update(self, records, removed_ids):
+        """
+        Adds or replaces the rows of [(id, numeric, type_id, tag_ids)] and
+        removes the rows of removed_ids, if present.
+        """
+        ids, types, raw, vectors = self.data
+        drop = [self.rows[pid] for pid in removed_ids if pid in self.rows]
+        drop += [self.rows[record[0]] for record in records
+                 if record[0] in self.rows]
+        if not drop and not records:
+            return
+        keep = np.ones(len(ids), dtype=bool)
+        keep[drop] = False
+        ids = np.append(ids[keep], np.array(
+            [record[0] for record in records], dtype=np.int64
+        ))
+        types = np.append(types[keep], np.array(
+            [record[2] or 0 for record in records], dtype=np.int64
+        ))
+        raw = np.vstack([raw[keep], np.array(
+            [record[1] for record in records], dtype=np.float32
+        ).reshape(-1, NUMERIC_WIDTH)])
+        vectors = np.vstack([vectors[keep], self.encode(
+            [record[1] for record in records],
+            [{record[2]: 1.0} if record[2] else {} for record in records],
+            [dict.fromkeys(record[3], 1.0) for record in records],
+        )])
+        self.rows = {int(pid): row for row, pid in enumerate(ids)}
+        self.data = (ids, types, raw, vectors)
+
+
+def _top_k(data, profiles, masks, limit):
+    """
+    Returns, for each profile vector, the [(property_id, score)] of the
+    limit most similar rows of data allowed by its boolean mask.
+    """
+    ids, _types, _raw, vectors = data
+    if not len(ids):
+        return [[] for _profile in profiles]
+    results = []
+    for row_scores, mask in zip(profiles @ vectors.T, masks):
+        count = min(limit, int(np.count_nonzero(mask)))
+        if not count:
+            results.append([])
+            continue
+        row_scores = np.where(mask, row_scores, -np.inf)
+        best = np.argpartition(-row_scores, count - 1)[:count]
+        best = best[np.argsort(-row_scores[best])]
+        results.append([
+            (int(ids[row]), round(float(row_scores[row]), 4))
+            for row in best
+        ])
+    return results
+
+
+def _advance(cursor, last, now):
+    """
+    Cursor after the (timestamp, id) last, kept SYNC_SAFETY_MARGIN behind
+    now so changes of transactions committing late are read again.
+    """
+    candidate = min(list(last), _horizon(now))
+    return max(cursor, candidate) if cursor else candidate
+
+
+class EstatePropertyMatching(models.AbstractModel):
+    """
+    Estate Property Matching Model
+
+    The index is read with a dedicated cursor, so it only ever contains
+    committed data, and is shared by all the requests of a worker.
+    """
+
+    _name = "estate.property.matching"
+    _description = "Real Estate Buyer Matching"
+
+    def _properties_query(self, where):
+        field = self.env['estate.property']._fields['tag_ids']
+        return f"""
+            SELECT p.id, p.write_date,
+                   p.active AND p.state IN %s,
+                   p.expected_price, COALESCE(p.living_area, 0),
+                   COALESCE(p.garden_area, 0), COALESCE(p.bedrooms, 0),
+                   p.property_type_id,
+                   ARRAY(SELECT r.{field.column2} FROM {field.relation} r
+                          WHERE r.{field.column1} = p.id)
+              FROM estate_property p
+             WHERE {where}
+          ORDER BY p.write_date, p.id
+        """
+
+    @staticmethod
+    def _to_record(row):
+        """(id, numeric, type_id, tag_ids) of a _properties_query row."""
+        return (row[0], [np.log1p(row[3]), row[4], row[5], row[6]],
+                row[7], row[8])
+
+    def _build_index(self, cr):
+        """Loads the available properties into a new index."""
+        now = fields.Datetime.now()
+        cr.execute("""
+            SELECT create_date, id FROM estate_sync_tombstone
+             WHERE res_model = 'estate.property'
+          ORDER BY create_date DESC, id DESC
+             LIMIT 1
+        """)
+        tombstone = cr.fetchone()
+        cr.execute(
+            self._properties_query("p.active AND p.state IN %s"),
+            (AVAILABLE_STATES, AVAILABLE_STATES),
+        )
+        records = [self._to_record(row) for row in cr.fetchall()]
+        cr.execute("SELECT id FROM estate_property_type ORDER BY id")
+        type_ids = [row[0] for row in cr.fetchall()]
+        cr.execute("SELECT id FROM estate_property_tag ORDER BY id")
+        tag_ids = [row[0] for row in cr.fetchall()]
+
+        numeric = np.array(
+            [record[1] for record in records], dtype=np.float32
+        ).reshape(-1, NUMERIC_WIDTH)
+        mean = numeric.mean(axis=0) if len(numeric) else np.zeros(
+            NUMERIC_WIDTH, dtype=np.float32
+        )
+        std = numeric.std(axis=0) if len(numeric) else np.ones(
+            NUMERIC_WIDTH, dtype=np.float32
+        )
+        std[std == 0] = 1.0
+        index = _FeatureIndex(type_ids, tag_ids, mean, std)
+        index.update(records, [])
+        index.cursor = _horizon(now)
+        index.tombstone_cursor = _advance(None, tombstone or index.cursor,
+                                          now)
+        _logger.info(
+            "Property matching index built: %s properties, %s features",
+            len(index.data[0]), index.width
+        )
+        return index
+
+    def _apply_changes(self, cr, index):
+        """
+        Applies the properties changed or deleted since the index cursors.
+        Returns False when a rebuild is required instead.
+        """
+        now = fields.Datetime.now()
+        cr.execute(
+            self._properties_query("(p.write_date, p.id) > (%s, %s)")
+            + " LIMIT %s",
+            (AVAILABLE_STATES, *index.cursor, MAX_DELTA_SIZE + 1),
+        )
+        rows = cr.fetchall()
+        if len(rows) > MAX_DELTA_SIZE:
+            return False
+        available = [self._to_record(row) for row in rows if row[2]]
+        if not index.knows({record[2] for record in available},
+                           {tag for record in available for tag in record[3]}):
+            return False
+        index.update(available, [row[0] for row in rows if not row[2]])
+        if rows:
+            index.cursor = _advance(
+                index.cursor, (rows[-1][1], rows[-1][0]), now
+            )
+
+        cr.execute("""
+            SELECT res_id, create_date, id FROM estate_sync_tombstone
+             WHERE res_model = 'estate.property'
+               AND (create_date, id) > (%s, %s)
+          ORDER BY create_date, id
+        """, index.tombstone_cursor)
+        tombstones = cr.fetchall()
+        index.update([], [row[0] for row in tombstones])
+        if tombstones:
+            index.tombstone_cursor = _advance(
+                index.tombstone_cursor, tombstones[-1][1:], now
+            )
+        return True
+
+    def _get_index(self):
+        """
+        Returns the index of the current database, at most REFRESH_INTERVAL
+        seconds behind. Callers read index.data once and use that snapshot.
+
+        A fresh index is returned without locking nor querying. Otherwise
+        one thread takes the lock and a cursor to bring it up to date; the
+        others keep using the current index instead of waiting, unless
+        there is none yet.
+        """
+        dbname = self.env.cr.dbname
+        index = _indexes.get(dbname)
+        if index is not None and index.is_fresh():
+            return index
+        if not _indexes_lock.acquire(blocking=index is None):
+            return index
+        try:
+            index = _indexes.get(dbname)
+            if index is not None and index.is_fresh():
+                return index
+            with self.env.registry.cursor() as cr:
+                if (
+                    index is None
+                    or time.monotonic() - index.built_at > REBUILD_INTERVAL
+                    or not self._apply_changes(cr, index)
+                ):
+                    index = _indexes[dbname] = self._build_index(cr)
+            index.checked_at = time.monotonic()
+            return index
+        finally:
+            _indexes_lock.release()
+
+    def _get_profiles(self, partners, index, data):
+        """
+        Returns, for each partner, its profile vector and the mask of the
+        properties allowed by its criteria (and not already bid on).
+
+        Numeric features average the properties the partner bid on (at
+        the offered price); stated criteria take precedence. Types and
+        tags are weighted by their frequency in the offers, stated ones
+        count fully.
+        """
+        self.env['estate.property.offer'].flush_model()
+        self.env.cr.execute("""
+            SELECT o.partner_id, o.price, COALESCE(p.living_area, 0),
+                   COALESCE(p.garden_area, 0), COALESCE(p.bedrooms, 0),
+                   p.property_type_id, p.id
+              FROM estate_property_offer o
+              JOIN estate_property p ON p.id = o.property_id
+             WHERE o.partner_id IN %s
+        """, (tuple(partners.ids),))
+        offers = {}
+        for row in self.env.cr.fetchall():
+            offers.setdefault(row[0], []).append(row)
+        tag_field = self.env['estate.property']._fields['tag_ids']
+        property_tags = {}
+        bid_ids = {row[6] for rows in offers.values() for row in rows}
+        if bid_ids:
+            self.env.cr.execute(f"""
+                SELECT {tag_field.column1}, {tag_field.column2}
+                  FROM {tag_field.relation}
+                 WHERE {tag_field.column1} IN %s
+            """, (tuple(bid_ids),))
+            for property_id, tag_id in self.env.cr.fetchall():
+                property_tags.setdefault(property_id, []).append(tag_id)
+
+        numeric, type_weights, tag_weights, masks = [], [], [], []
+        for partner in partners:
+            rows = offers.get(partner.id, [])
+            values = np.full(NUMERIC_WIDTH, np.nan)
+            types, tags = {}, {}
+            if rows:
+                values = np.array([
+                    [np.log1p(row[1]), row[2], row[3], row[4]]
+                    for row in rows
+                ]).mean(axis=0)
+                for row in rows:
+                    if row[5]:
+                        types[row[5]] = types.get(row[5], 0) + 1 / len(rows)
+                    for tag_id in property_tags.get(row[6], []):
+                        tags[tag_id] = tags.get(tag_id, 0) + 1 / len(rows)
+            prices = [
+                price for price in (partner.buyer_min_price,
+                                    partner.buyer_max_price) if price
+            ]
+            if prices:
+                values[0] = np.log1p(sum(prices) / len(prices))
+            if partner.buyer_min_living_area:
+                values[1] = partner.buyer_min_living_area
+            if partner.buyer_min_bedrooms:
+                values[3] = partner.buyer_min_bedrooms
+            types.update(dict.fromkeys(partner.buyer_property_type_ids.ids,
+                                       1.0))
+            tags.update(dict.fromkeys(partner.buyer_tag_ids.ids, 1.0))
+            numeric.append(values)
+            type_weights.append(types)
+            tag_weights.append(tags)
+            masks.append(self._get_mask(partner, data, {
+                row[6] for row in rows
+            }))
+        return index.encode(numeric, type_weights, tag_weights), masks
+
+    def _get_mask(self, partner, data, bid_ids):
+        """Properties of the index allowed by the criteria of partner."""
+        ids, types, raw, _vectors = data
+        mask = np.ones(len(ids), dtype=bool)
+        if partner.buyer_min_price:
+            mask &= raw[:, 0] >= np.log1p(partner.buyer_min_price)
+        if partner.buyer_max_price:
+            mask &= raw[:, 0] <= np.log1p(partner.buyer_max_price)
+        if partner.buyer_min_living_area:
+            mask &= raw[:, 1] >= partner.buyer_min_living_area
+        if partner.buyer_min_bedrooms:
+            mask &= raw[:, 3] >= partner.buyer_min_bedrooms
+        if partner.buyer_property_type_ids:
+            mask &= np.isin(types, partner.buyer_property_type_ids.ids)
+        if bid_ids:
+            mask &= ~np.isin(ids, list(bid_ids))
+        return mask
+
+    @api.model
+    @instrumented
+    def match(self, partners, limit=DEFAULT_MATCH_LIMIT):
+        """
+        Returns {partner_id: [(property_id, score)]}: the limit available
+        properties most similar to each partner, best first, restricted
+        to the properties readable by the current user and still available.
+        """
+        if not partners:
+            return {}
+        index = self._get_index()
+        data = index.data
+        matches = {}
+        for start in range(0, len(partners), MATCH_CHUNK_SIZE):
+            chunk = partners[start:start + MATCH_CHUNK_SIZE]
+            profiles, masks = self._get_profiles(chunk, index, data)
+            for partner, result in zip(
+                chunk, _top_k(data, profiles, masks, limit)
+            ):
+                matches[partner.id] = result
+        # Also drops the properties sold or archived since the last refresh
+        readable = set(self.env['estate.property'].search([
+            ('id', 'in', list({
+                property_id for result in matches.values()
+                for property_id, _score in result
+            })),
+            ('state', 'in', AVAILABLE_STATES),
+        ]).ids)
+        return {
+            partner_id: [item for item in result if item[0] in readable]
+            for partner_id, result in matches.items()
+        }
@@ -9,21 +9,29 @@ acceptance/refusal, and deadline calculations.
 Key Features:
 - Offer price management with validation rules
 - Automatic deadline calculation based on validity period
+- Scheduled expiry of offers past their deadline
 - Offer status tracking (accepted/refused)
 - Property state management on offer actions
 - Price constraints and validation rules
+- Real-time bus notifications to the salesperson, coalesced per property
 
 Technical Details:
 - Model Name: estate.property.offer
 - Table Name: estate_property_offer
-- Dependencies: estate.property, res.partner
+- Dependencies: estate.property, res.partner, bus.bus
 - Order: Descending by price
 """
 
-from odoo import api, fields, models, exceptions  # type: ignore
+from odoo import api, fields, models, exceptions, tools  # type: ignore
 from odoo.tools import float_utils  # type: ignore
+from ..tools.instrumentation import instrumented
 from datetime import timedelta
 
+# Number of expired offers refused per run of the expiry cron
+EXPIRY_BATCH_SIZE = 1000
+# Bus notification sent to the salesperson when offers change
+OFFER_NOTIFICATION_TYPE = 'state.offer_updated'
+
 
 class EstatePropertyOffer(models.Model):
     """
@@ -55,6 +63,7 @@ class EstatePropertyOffer(models.Model):
             ('refused', 'Refused')
         ],
         copy=False,
+        index=True,
         help="Current status of the offer"
     )
 
@@ -67,6 +76,7 @@ class EstatePropertyOffer(models.Model):
     property_id = fields.Many2one(
         'estate.property',
         required=True,
+        ondelete='cascade',
         help="Property for which offer is made"
     )
 
@@ -87,6 +97,7 @@ class EstatePropertyOffer(models.Model):
         "estate.property.type",
         related="property_id.property_type_id",
         store=True,
+        index=True,
         help="Property type from related property"
     )
 
@@ -99,93 +110,270 @@ class EstatePropertyOffer(models.Model):
         )
     ]
 
-    @api.depends("validity", "date_deadline")
+    def init(self):
+        """
+        Creates the composite index matching the offer lists of a property,
+        which are always filtered by property and ordered by price desc.
+        It also serves plain lookups by property_id. The (write_date, id)
+        index backs the keyset of the delta sync.
+        """
+        tools.create_index(
+            self._cr,
+            'estate_property_offer_property_price_index',
+            self._table,
+            ['property_id', 'price DESC'],
+        )
+        tools.create_index(
+            self._cr,
+            'estate_property_offer_write_date_index',
+            self._table,
+            ['write_date', 'id'],
+        )
+
+    @api.depends("create_date", "validity")
+    @instrumented
     def _compute_date_deadline(self):
         """
             Computes deadline date based on creation date and validity period.
+            Offers not saved yet start from today.
         """
+        today = fields.Date.today()
         for record in self:
-            if not record.create_date:
-                record.date_deadline = (
-                    fields.Date.today() + timedelta(days=record.validity)
-                )
-            else:
-                create_date = fields.Datetime.from_string(record.create_date)
-                deadline_date = create_date + timedelta(days=record.validity)
-                record.date_deadline = deadline_date.date()
+            start = record.create_date.date() if record.create_date else today
+            record.date_deadline = start + timedelta(days=record.validity)
 
     def _inverse_date_deadline(self):
         """Updates validity days when deadline date is manually changed."""
         for record in self:
             if record.date_deadline and record.create_date:
-                deadline_date = fields.Date.from_string(record.date_deadline)
-                create_date = fields.Datetime.from_string(record.create_date)
-                record.validity = (deadline_date - create_date.date()).days
+                record.validity = (
+                    record.date_deadline - record.create_date.date()
+                ).days
 
+    @api.model
+    @instrumented
+    def _cron_expire_offers(self, batch_size=None):
+        """
+        Refuses the pending offers past their deadline, one bounded batch
+        per call, and resets to 'New' the properties left without any open
+        offer. The cron triggers itself again while expired offers remain.
+        """
+        batch_size = batch_size or EXPIRY_BATCH_SIZE
+        expired = self.search([
+            ('status', '=', False),
+            ('date_deadline', '<', fields.Date.today()),
+        ], limit=batch_size)
+        if not expired:
+            return
+        expired.write({'status': 'refused'})
+        expired._notify_offer_updates()
+
+        properties = expired.property_id.filtered(
+            lambda record: record.state == 'offer_received'
+        )
+        still_open = self._read_group(
+            [
+                ('property_id', 'in', properties.ids),
+                ('status', '!=', 'refused'),
+            ],
+            ['property_id'],
+        )
+        properties -= properties.browse(
+            [property_id.id for property_id, in still_open]
+        )
+        if properties:
+            properties.write({'state': 'new'})
+
+        if len(expired) == batch_size:
+            self.env.ref('state.ir_cron_expire_offers')._trigger()
+
+    @instrumented
     def action_accepted(self):
         """
-        Accepts the offer and updates related property information.
-        Raises error if another offer is already accepted.
+        Accepts the offers and updates related property information.
+
+        Conflicts are detected for the whole recordset at once: a batch may
+        hold at most one offer per property, and none of the properties may
+        already have another accepted offer.
         """
+        properties = self.property_id
+        if len(properties) != len(self):
+            raise exceptions.UserError(
+                "You cannot accept several offers for the same property."
+            )
+        conflicts = self._read_group(
+            [
+                ('property_id', 'in', properties.ids),
+                ('status', '=', 'accepted'),
+                ('id', 'not in', self.ids),
+            ],
+            ['property_id'],
+        )
+        if conflicts:
+            raise exceptions.UserError(
+                "This property already has an accepted offer: "
+                + ", ".join(prop.name for prop, in conflicts)
+            )
+        self.write({'status': 'accepted'})
         for record in self:
-            if record.property_id.offer_ids.filtered(
-                lambda o: o.status == 'accepted' and o.id != record.id
-            ):
-                raise exceptions.UserError(
-                    "This property already has an accepted offer."
-                )
-            record.status = "accepted"
-            record.property_id.selling_price = record.price
-            record.property_id.buyer = record.partner_id
-            record.property_id.state = "offer_accepted"
+            record.property_id.write({
+                'selling_price': record.price,
+                'buyer': record.partner_id.id,
+                'state': 'offer_accepted',
+            })
+        self._notify_offer_updates()
 
+    @instrumented
     def action_refused(self):
-        """Marks the offer as refused."""
+        """Marks the offers as refused."""
+        self.write({'status': 'refused'})
+        self._notify_offer_updates()
+
+    def _notify_offer_updates(self):
+        """
+        Queues a bus notification for the properties of the offers.
+
+        Notifications are coalesced for the whole transaction and sent just
+        before commit: one message per property, carrying its final state,
+        best price and the ids of every offer changed meanwhile, addressed
+        to the salesperson of the property.
+        """
+        if not self:
+            return
+        precommit = self.env.cr.precommit
+        pending = precommit.data.get(OFFER_NOTIFICATION_TYPE)
+        if pending is None:
+            pending = precommit.data[OFFER_NOTIFICATION_TYPE] = {}
+            env = self.env
+            precommit.add(
+                lambda: env['estate.property.offer']
+                ._send_offer_notifications(pending)
+            )
         for record in self:
-            record.status = "refused"
+            pending.setdefault(record.property_id.id, set()).add(record.id)
+
+    @api.model
+    def _send_offer_notifications(self, pending):
+        """Sends the notifications queued by _notify_offer_updates."""
+        properties = self.env['estate.property'].sudo().browse(
+            list(pending)
+        ).exists()
+        notifications = [
+            (record.salesperson.partner_id, OFFER_NOTIFICATION_TYPE, {
+                'property_id': record.id,
+                'state': record.state,
+                'best_price': record.best_price,
+                'offer_ids': sorted(pending[record.id]),
+            })
+            for record in properties
+            if record.salesperson
+        ]
+        if notifications:
+            self.env['bus.bus'].sudo()._sendmany(notifications)
 
     @api.constrains('price')
+    @instrumented
     def check_price(self):
         """
         Validates that offer price is at least 90% of expected price.
-        Raises UserError if validation fails.
+
+        The expected prices of all referenced properties are fetched with a
+        single read; every offer is then checked in one pass and a single
+        UserError lists all the violating offers.
         """
+        expected_prices = {
+            values['id']: values['expected_price']
+            for values in self.property_id.read(['expected_price'])
+        }
+        # CHECK(expected_price > 0) makes a zero expected price impossible
+        violations = []
         for record in self:
-            if (
-                not float_utils.float_is_zero(
-                    record.property_id.expected_price, precision_digits=2
-                )
-                and float_utils.float_compare(
-                    record.price,
-                    0.9 * record.property_id.expected_price,
-                    precision_digits=2
-                ) < 0
-            ):
-                raise exceptions.UserError(
-                    "The offer price cannot be lower than 90% of the expected"
-                    "price! The expected price is "
-                    f"{record.property_id.expected_price:,.2f}"
+            expected_price = expected_prices[record.property_id.id]
+            if float_utils.float_compare(
+                record.price, 0.9 * expected_price, precision_digits=2
+            ) < 0:
+                violations.append(
+                    f"- {record.property_id.display_name}: offer of "
+                    f"{record.price:,.2f}, expected price is "
+                    f"{expected_price:,.2f}"
                 )
+        if violations:
+            raise exceptions.UserError(
+                "The offer price cannot be lower than 90% of the expected "
+                "price!\n" + "\n".join(violations)
+            )
 
-    @api.model
-    def create(self, vals):
+    @api.ondelete(at_uninstall=False)
+    def _unlink_record_sync_tombstones(self):
+        """Records the deletions for the delta sync of the mobile app."""
+        self.env['estate.sync.tombstone']._record(self)
+
+    @api.model_create_multi
+    @instrumented
+    def create(self, vals_list):
         """
         Override create method to add additional validations:
         - Prevents creation of offers lower than existing ones
         - Updates property state to 'offer_received'
+
+        The properties are locked first (see _lock_for_bidding), so
+        concurrent bids on the same property are serialized and always
+        compared against the current best offer. Offers of the same batch
+        are checked in order, as if they had been created one by one.
         """
-        if 'property_id' in vals:
-            property_id = vals['property_id']
-            property_obj = self.env['estate.property'].browse(property_id)
-            if 'price' in vals:
-                new_offer_price = vals['price']
-                existing_offers = property_obj.offer_ids.filtered(
-                    lambda offer: offer.price > new_offer_price
+        property_ids = {
+            vals['property_id'] for vals in vals_list
+            if vals.get('property_id')
+        }
+        best_prices = self._lock_for_bidding(property_ids)
+        for vals in vals_list:
+            property_id = vals.get('property_id')
+            if not property_id or 'price' not in vals:
+                continue
+            new_offer_price = vals['price']
+            if best_prices.get(property_id, 0.0) > new_offer_price:
+                raise exceptions.UserError(
+                    "You cannot create an offer "
+                    "with a lower amount than an existing offer."
                 )
-                if existing_offers:
-                    raise exceptions.UserError(
-                        "You cannot create an offer "
-                        "with a lower amount than an existing offer."
-                    )
-            property_obj.write({'state': 'offer_received'})
-        return super().create(vals)
+            best_prices[property_id] = new_offer_price
+        properties = self.env['estate.property'].browse(property_ids)
+        properties.filtered(
+            lambda record: record.state != 'offer_received'
+        ).write({'state': 'offer_received'})
+        offers = super().create(vals_list)
+        offers._notify_offer_updates()
+        return offers
+
+    @api.model
+    def _lock_for_bidding(self, property_ids):
+        """
+        Locks the rows of the properties and returns their current best
+        offer price, computed in SQL: {property_id: price}.
+
+        The rows are locked FOR NO KEY UPDATE in id order: concurrent bids
+        on a property wait for each other, batches cannot deadlock, and the
+        lock does not block the foreign keys of the offers being inserted.
+        When another bid committed in the meantime, PostgreSQL reports the
+        serialization failure right here, before any work is done, and the
+        request is retried by the server against the new best offer.
+        """
+        if not property_ids:
+            return {}
+        ids = tuple(sorted(property_ids))
+        self.flush_model(['property_id', 'price'])
+        cr = self.env.cr
+        cr.execute("""
+            SELECT id FROM estate_property
+             WHERE id IN %s
+          ORDER BY id
+               FOR NO KEY UPDATE
+        """, (ids,))
+        best_prices = dict.fromkeys((row[0] for row in cr.fetchall()), 0.0)
+        cr.execute(f"""
+            SELECT property_id, MAX(price) FROM {self._table}
+             WHERE property_id IN %s
+          GROUP BY property_id
+        """, (ids,))
+        best_prices.update(cr.fetchall())
+        return best_prices
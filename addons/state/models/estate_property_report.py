@@ -0,0 +1,222 @@
+"""
+Estate Property Report Model
+===========================
+
+This module defines the sales analytics report of the real estate pipeline.
+It is backed by a SQL view aggregating the offers of every active property
+and of every property moved to the archive tables, so pivots and graphs
+never join and aggregate the business tables on the fly in Python.
+
+Key Features:
+- Offers count, total, average and best offer price per property
+- Average offer weighted by the number of offers when grouped
+- Time to sale and sold vs expected price ratio
+- Grouping by property type, salesperson, postcode and month
+- Optional PostgreSQL materialized view, refreshed concurrently by a
+  scheduled action (system parameter state.report_materialized)
+
+Technical Details:
+- Model Name: estate.property.report
+- Table Name: estate_property_report (view or materialized view)
+- Dependencies: estate.property, estate.property.offer,
+  estate.property.archive, estate.property.offer.archive
+"""
+
+from odoo import api, fields, models, tools  # type: ignore
+from odoo.tools import SQL  # type: ignore
+from ..tools.instrumentation import instrumented
+
+MATERIALIZED_PARAM = 'state.report_materialized'
+
+
+class EstatePropertyReport(models.Model):
+    """
+    Estate Property Report Model
+
+    One read-only line per active or archived property, with its offer
+    aggregates. Archived properties have a negative id (the opposite of
+    their estate_property_archive id) and no property_id.
+    Switching state.report_materialized takes effect on module update.
+    """
+
+    _name = "estate.property.report"
+    _description = "Real Estate Sales Analysis"
+    _auto = False
+    _order = "date desc"
+
+    property_id = fields.Many2one('estate.property', readonly=True)
+    archived = fields.Boolean(
+        readonly=True,
+        help="The property was moved to the archive tables"
+    )
+    property_type_id = fields.Many2one(
+        'estate.property.type', string='Property Type', readonly=True
+    )
+    salesperson_id = fields.Many2one(
+        'res.users', string='Salesperson', readonly=True
+    )
+    postcode = fields.Char(readonly=True)
+    state = fields.Selection(
+        selection=[
+            ('new', 'New'),
+            ('offer_received', 'Offer Received'),
+            ('offer_accepted', 'Offer Accepted'),
+            ('sold', 'Sold'),
+            ('canceled', 'Canceled'),
+        ],
+        readonly=True,
+    )
+    date = fields.Date(string='Listed On', readonly=True)
+    date_sold = fields.Date(string='Sold On', readonly=True)
+    expected_price = fields.Float(readonly=True)
+    selling_price = fields.Float(readonly=True)
+    offer_count = fields.Integer(string='Offers', readonly=True)
+    offer_price_sum = fields.Float(string='Offers Total', readonly=True)
+    avg_offer_price = fields.Float(
+        string='Average Offer', readonly=True, group_operator='avg'
+    )
+    max_offer_price = fields.Float(
+        string='Best Offer', readonly=True, group_operator='max'
+    )
+    days_to_sale = fields.Float(
+        string='Days to Sale', readonly=True, group_operator='avg'
+    )
+    price_ratio = fields.Float(
+        string='Sold / Expected', readonly=True, group_operator='avg',
+        help="Selling price divided by expected price, for sold properties"
+    )
+
+    def _query(self):
+        return """
+            SELECT
+                p.id AS id,
+                p.id AS property_id,
+                p.property_type_id AS property_type_id,
+                p.salesperson AS salesperson_id,
+                p.postcode AS postcode,
+                p.state AS state,
+                p.create_date::date AS date,
+                p.date_sold AS date_sold,
+                p.expected_price AS expected_price,
+                p.selling_price AS selling_price,
+                COALESCE(o.offer_count, 0) AS offer_count,
+                o.offer_price_sum AS offer_price_sum,
+                o.offer_price_sum / o.offer_count AS avg_offer_price,
+                o.max_offer_price AS max_offer_price,
+                p.date_sold - p.create_date::date AS days_to_sale,
+                CASE
+                    WHEN p.state = 'sold' AND p.expected_price > 0
+                    THEN p.selling_price / p.expected_price
+                END AS price_ratio,
+                FALSE AS archived
+            FROM estate_property p
+            LEFT JOIN (
+                SELECT
+                    property_id,
+                    COUNT(*) AS offer_count,
+                    SUM(price) AS offer_price_sum,
+                    MAX(price) AS max_offer_price
+                FROM estate_property_offer
+                GROUP BY property_id
+            ) o ON o.property_id = p.id
+            WHERE p.active
+            UNION ALL
+            SELECT
+                -a.id AS id,
+                NULL AS property_id,
+                a.property_type_id AS property_type_id,
+                a.salesperson AS salesperson_id,
+                a.postcode AS postcode,
+                a.state AS state,
+                a.date_listed::date AS date,
+                a.date_sold AS date_sold,
+                a.expected_price AS expected_price,
+                a.selling_price AS selling_price,
+                COALESCE(o.offer_count, 0) AS offer_count,
+                o.offer_price_sum AS offer_price_sum,
+                o.offer_price_sum / o.offer_count AS avg_offer_price,
+                o.max_offer_price AS max_offer_price,
+                a.date_sold - a.date_listed::date AS days_to_sale,
+                CASE
+                    WHEN a.state = 'sold' AND a.expected_price > 0
+                    THEN a.selling_price / a.expected_price
+                END AS price_ratio,
+                TRUE AS archived
+            FROM estate_property_archive a
+            LEFT JOIN (
+                SELECT
+                    property_archive_id,
+                    COUNT(*) AS offer_count,
+                    SUM(price) AS offer_price_sum,
+                    MAX(price) AS max_offer_price
+                FROM estate_property_offer_archive
+                GROUP BY property_archive_id
+            ) o ON o.property_archive_id = a.id
+        """
+
+    def _read_group_select(self, aggregate_spec, query):
+        """
+        Averages the offers of the grouped properties, not their per-property
+        averages: a property with ten offers weighs ten times more than a
+        property with one.
+        """
+        if aggregate_spec != 'avg_offer_price:avg':
+            return super()._read_group_select(aggregate_spec, query)
+        return SQL(
+            "SUM(%s) / NULLIF(SUM(%s), 0)",
+            SQL.identifier(self._table, 'offer_price_sum'),
+            SQL.identifier(self._table, 'offer_count'),
+        )
+
+    def _get_relkind(self):
+        """Returns 'v' (view), 'm' (materialized view) or None."""
+        self.env.cr.execute(
+            "SELECT relkind FROM pg_class WHERE relname = %s",
+            (self._table,)
+        )
+        row = self.env.cr.fetchone()
+        return row and row[0]
+
+    def _is_materialized(self):
+        value = self.env['ir.config_parameter'].sudo().get_param(
+            MATERIALIZED_PARAM, ''
+        )
+        return value.lower() in ('1', 'true')
+
+    def init(self):
+        cr = self.env.cr
+        if self._get_relkind() == 'm':
+            cr.execute(f'DROP MATERIALIZED VIEW "{self._table}"')
+        else:
+            tools.drop_view_if_exists(cr, self._table)
+
+        if not self._is_materialized():
+            cr.execute(
+                f'CREATE VIEW "{self._table}" AS ({self._query()})'
+            )
+            return
+        cr.execute(
+            f'CREATE MATERIALIZED VIEW "{self._table}" AS ({self._query()})'
+        )
+        # The unique index is required by REFRESH ... CONCURRENTLY
+        tools.create_unique_index(
+            cr, f'{self._table}_id_index', self._table, ['id']
+        )
+        tools.create_index(
+            cr, f'{self._table}_date_index', self._table, ['date']
+        )
+        tools.create_index(
+            cr, f'{self._table}_property_type_index', self._table,
+            ['property_type_id']
+        )
+
+    @api.model
+    @instrumented
+    def _cron_refresh(self):
+        """Refreshes the materialized view without blocking readers."""
+        if self._get_relkind() != 'm':
+            return
+        self.env.cr.execute(
+            f'REFRESH MATERIALIZED VIEW CONCURRENTLY "{self._table}"'
+        )
+        self.invalidate_model()
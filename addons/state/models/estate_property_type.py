@@ -21,6 +21,7 @@ Technical Details:
 """
 
 from odoo import api, models, fields  # type: ignore
+from ..tools.instrumentation import instrumented
 
 
 class EstatePropertyType(models.Model):
@@ -35,7 +36,9 @@ class EstatePropertyType(models.Model):
     - property_ids: Properties of this type
     - offer_ids: Offers made on properties of this type
     - sequence: Custom ordering number
-    - offer_count: Computed number of offers
+    - fold: Folded kanban column
+    - offer_count: Number of offers
+    - property_count: Number of active properties
     """
 
     _name = "estate.property.type"
@@ -59,6 +62,11 @@ class EstatePropertyType(models.Model):
     sequence = fields.Integer(
         help="Used to customize the order of property types"
     )
+    fold = fields.Boolean(
+        string="Folded in Kanban",
+        help="Fold this column in the property kanban view, its cards are "
+             "only loaded when the column is opened"
+    )
 
     # Offer Management
     offer_ids = fields.One2many(
@@ -66,19 +74,56 @@ class EstatePropertyType(models.Model):
         'property_type_id',
         help="Offers made on properties of this type"
     )
+    # Counters are not stored: a stored counter would rewrite the shared
+    # type row on every offer, making concurrent bids on properties of the
+    # same type conflict with each other.
     offer_count = fields.Integer(
         compute="_compute_offer_count",
         help="Total number of offers for this property type"
     )
+    property_count = fields.Integer(
+        compute="_compute_property_count",
+        help="Total number of active properties of this type"
+    )
 
     @api.depends("offer_ids")
+    @instrumented
     def _compute_offer_count(self):
         """
-        Computes the total number of offers for each property type.
-        This method is automatically triggered when offer_ids changes.
+        Computes the total number of offers for each property type, with a
+        single grouped query over all the types of the recordset.
         """
+        counts = self._get_grouped_counts("estate.property.offer")
+        for record in self:
+            record.offer_count = counts.get(record.id, len(record.offer_ids))
+
+    @api.depends("property_ids.active")
+    @instrumented
+    def _compute_property_count(self):
+        """Computes the number of active properties of each type."""
+        counts = self._get_grouped_counts("estate.property")
         for record in self:
-            record.offer_count = len(record.offer_ids)
+            record.property_count = counts.get(
+                record.id, len(record.property_ids)
+            )
+
+    def _get_grouped_counts(self, model_name):
+        """
+        Returns {type_id: count} for the persisted types of the recordset,
+        computed with one _read_group on model_name grouped by
+        property_type_id. Types without any record are mapped to 0.
+        """
+        stored = self.filtered("id")
+        if not stored:
+            return {}
+        counts = dict.fromkeys(stored.ids, 0)
+        for property_type, count in self.env[model_name]._read_group(
+            [("property_type_id", "in", stored.ids)],
+            ["property_type_id"],
+            ["__count"],
+        ):
+            counts[property_type.id] = count
+        return counts
 
     # Database Constraints
     _sql_constraints = [
@@ -0,0 +1,294 @@
+"""
+Estate Property Valuation Model
+==============================
+
+This module defines the valuation engine of the real estate module. A linear
+regression is fitted with NumPy on the sold properties (archived ones
+included) and used to suggest a price for the listings, stored in
+estate.property.estimated_price.
+
+Key Features:
+- Least-squares fit on living area, garden area, bedrooms, facades, garage,
+  property type and postcode (one-hot encoded)
+- Coefficients cached in the state.valuation_model system parameter and
+  parsed once per process
+- Whole recordsets scored in one vectorized pass, written back with
+  batched SQL updates
+- Scheduled refit and rescoring of the open listings
+
+Technical Details:
+- Model Name: estate.property.valuation
+- Abstract: no table, service model only
+- Dependencies: estate.property, estate.property.archive, numpy
+"""
+
+from odoo import api, fields, models, exceptions, tools  # type: ignore
+from odoo.tools import split_every  # type: ignore
+from ..tools.instrumentation import instrumented
+from collections import Counter
+import json
+import logging
+import numpy as np  # type: ignore
+
+_logger = logging.getLogger(__name__)
+
+VALUATION_MODEL_PARAM = 'state.valuation_model'
+NUMERIC_FEATURES = (
+    'living_area', 'garden_area', 'bedrooms', 'facades', 'garage',
+)
+# Sold properties required to fit a model
+MIN_SAMPLES = 20
+# Postcodes get their own coefficient from this many sales, up to
+# MAX_POSTCODES of them; the others share the baseline
+MIN_POSTCODE_SAMPLES = 5
+MAX_POSTCODES = 100
+# Number of properties fetched and scored at a time
+SCORE_CHUNK_SIZE = 10000
+# Number of estimated prices written per UPDATE statement
+WRITE_CHUNK_SIZE = 1000
+
+FEATURES_SELECT = """
+    COALESCE(living_area, 0), COALESCE(garden_area, 0),
+    COALESCE(bedrooms, 0), COALESCE(facades, 0),
+    COALESCE(garage, false)::int, property_type_id, postcode
+"""
+
+
+def _one_hot(values, levels):
+    """Returns the (len(values), len(levels)) indicator matrix."""
+    lookup = {level: index for index, level in enumerate(levels)}
+    index = np.array([lookup.get(value, -1) for value in values], dtype=int)
+    matrix = np.zeros((len(values), len(levels)))
+    rows = np.nonzero(index >= 0)[0]
+    matrix[rows, index[rows]] = 1.0
+    return matrix
+
+
+def _level_coefficients(values, coefficients):
+    """
+    Returns the coefficient of the level of every value (0.0 for unknown
+    levels) with a single fancy-indexing lookup.
+    """
+    lookup = {level: index for index, level in enumerate(coefficients)}
+    table = np.append(np.array(list(coefficients.values())), 0.0)
+    index = np.array(
+        [lookup.get(value, -1) for value in values], dtype=int
+    )
+    return table[index]
+
+
+class EstatePropertyValuation(models.AbstractModel):
+    """
+    Estate Property Valuation Model
+
+    The fitted model is stored as JSON:
+    {'intercept': float, 'numeric': {field: coefficient},
+     'types': {type_id: coefficient}, 'postcodes': {postcode: coefficient},
+     'samples': int, 'r2': float, 'rmse': float, 'fitted_at': datetime}
+    """
+
+    _name = "estate.property.valuation"
+    _description = "Real Estate Property Valuation"
+
+    @api.model
+    def _get_model(self):
+        """Returns the fitted model, or None when none was fitted yet."""
+        raw = self.env['ir.config_parameter'].sudo().get_param(
+            VALUATION_MODEL_PARAM
+        )
+        return self._parse_model(raw) if raw else None
+
+    @tools.ormcache('raw')
+    def _parse_model(self, raw):
+        model = json.loads(raw)
+        return {
+            'intercept': model['intercept'],
+            'numeric': np.array([
+                model['numeric'].get(name, 0.0) for name in NUMERIC_FEATURES
+            ]),
+            'types': {
+                int(type_id): coefficient
+                for type_id, coefficient in model['types'].items()
+            },
+            'postcodes': model['postcodes'],
+        }
+
+    def _fetch_training_rows(self):
+        """Features and selling price of the sold (and archived) properties."""
+        self.env['estate.property'].flush_model()
+        self.env.cr.execute(f"""
+            SELECT {FEATURES_SELECT}, selling_price
+              FROM estate_property
+             WHERE state = 'sold' AND selling_price > 0
+         UNION ALL
+            SELECT {FEATURES_SELECT}, selling_price
+              FROM estate_property_archive
+             WHERE state = 'sold' AND selling_price > 0
+        """)
+        return self.env.cr.fetchall()
+
+    @api.model
+    @instrumented
+    def fit(self):
+        """
+        Fits the model on the sold properties and stores it.
+        Returns the model, or None when there are not enough sales.
+        """
+        rows = self._fetch_training_rows()
+        if len(rows) < MIN_SAMPLES:
+            _logger.info(
+                "Valuation model not fitted: %s sale(s), %s required",
+                len(rows), MIN_SAMPLES
+            )
+            return None
+        data = np.array([row[:5] + (row[7],) for row in rows], dtype=float)
+        numeric, target = data[:, :5], data[:, 5]
+        types = [row[5] for row in rows]
+        postcodes = [row[6] for row in rows]
+
+        type_levels = sorted({type_id for type_id in types if type_id})
+        postcode_levels = [
+            postcode
+            for postcode, count in Counter(postcodes).most_common(
+                MAX_POSTCODES
+            )
+            if postcode and count >= MIN_POSTCODE_SAMPLES
+        ]
+        design = np.hstack([
+            np.ones((len(rows), 1)),
+            numeric,
+            _one_hot(types, type_levels),
+            _one_hot(postcodes, postcode_levels),
+        ])
+        # lstsq returns the minimum-norm solution, which copes with the
+        # collinearity of the intercept and complete one-hot blocks
+        coefficients = np.linalg.lstsq(design, target, rcond=None)[0]
+
+        residuals = target - design @ coefficients
+        variance = float(np.var(target))
+        offset = 1 + len(NUMERIC_FEATURES)
+        model = {
+            'intercept': float(coefficients[0]),
+            'numeric': dict(zip(
+                NUMERIC_FEATURES, coefficients[1:offset].tolist()
+            )),
+            'types': dict(zip(
+                map(str, type_levels),
+                coefficients[offset:offset + len(type_levels)].tolist(),
+            )),
+            'postcodes': dict(zip(
+                postcode_levels,
+                coefficients[offset + len(type_levels):].tolist(),
+            )),
+            'samples': len(rows),
+            'r2': (
+                1 - float(np.mean(residuals ** 2)) / variance
+                if variance else None
+            ),
+            'rmse': float(np.sqrt(np.mean(residuals ** 2))),
+            'fitted_at': fields.Datetime.to_string(fields.Datetime.now()),
+        }
+        self.env['ir.config_parameter'].sudo().set_param(
+            VALUATION_MODEL_PARAM, json.dumps(model)
+        )
+        _logger.info(
+            "Valuation model fitted on %s sale(s): R2 %s, RMSE %.2f",
+            model['samples'], model['r2'], model['rmse']
+        )
+        return model
+
+    @api.model
+    def predict(self, rows):
+        """
+        Returns the estimated prices of feature rows (as selected by
+        FEATURES_SELECT) in one vectorized pass, never below zero.
+        """
+        model = self._get_model()
+        if model is None:
+            raise exceptions.UserError(
+                "No valuation model is fitted yet: at least "
+                f"{MIN_SAMPLES} sold properties are required."
+            )
+        numeric = np.array([row[:5] for row in rows], dtype=float)
+        prices = (
+            model['intercept']
+            + numeric @ model['numeric']
+            + _level_coefficients([row[5] for row in rows], model['types'])
+            + _level_coefficients(
+                [row[6] for row in rows], model['postcodes']
+            )
+        )
+        return np.round(np.clip(prices, 0.0, None), 2)
+
+    @api.model
+    @instrumented
+    def estimate(self, properties):
+        """Scores the properties, fitting a model first if needed."""
+        if not properties:
+            return
+        properties.check_access_rights('write')
+        properties.check_access_rule('write')
+        if self._get_model() is None and self.fit() is None:
+            raise exceptions.UserError(
+                "Not enough sold properties to estimate prices: at least "
+                f"{MIN_SAMPLES} are required."
+            )
+        self._score("id IN %s", (tuple(properties.ids),))
+
+    @api.model
+    @instrumented
+    def _cron_refit(self):
+        """Refits the model and rescores every open listing."""
+        if self.fit() is None:
+            return
+        self._score("active AND state NOT IN ('sold', 'canceled')", ())
+
+    def _score(self, where, params):
+        """
+        Computes and stores the estimated price of the properties matching
+        the SQL condition, SCORE_CHUNK_SIZE properties at a time: pages are
+        fetched with keyset pagination on id, so memory stays bounded.
+        """
+        Property = self.env['estate.property']
+        Property.flush_model()
+        cr = self.env.cr
+        last_id, count = 0, 0
+        while True:
+            cr.execute(f"""
+                SELECT id, {FEATURES_SELECT}
+                  FROM estate_property
+                 WHERE ({where}) AND id > %s
+              ORDER BY id
+                 LIMIT %s
+            """, (*params, last_id, SCORE_CHUNK_SIZE))
+            rows = cr.fetchall()
+            if not rows:
+                break
+            prices = self.predict([row[1:] for row in rows])
+            self._write_estimates([
+                (row[0], price) for row, price in zip(rows, prices.tolist())
+            ])
+            last_id = rows[-1][0]
+            count += len(rows)
+        Property.invalidate_model(['estimated_price'])
+        _logger.info("%s property(ies) valued", count)
+
+    def _write_estimates(self, values):
+        """
+        Writes [(property_id, price)] with one UPDATE ... FROM (VALUES ...)
+        per WRITE_CHUNK_SIZE rows, bypassing the ORM: estimated prices are
+        derived data, they neither change write_date nor trigger
+        recomputations. The statements go through the Odoo cursor, so they
+        are logged and counted like any other query.
+        """
+        cr = self.env.cr
+        for chunk in split_every(WRITE_CHUNK_SIZE, values):
+            rows = b", ".join(
+                cr.mogrify("(%s, %s)", row) for row in chunk
+            ).decode()
+            cr.execute(f"""
+                UPDATE estate_property AS p
+                   SET estimated_price = v.price
+                  FROM (VALUES {rows}) AS v(id, price)
+                 WHERE p.id = v.id
+            """)
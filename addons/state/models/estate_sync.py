@@ -0,0 +1,260 @@
+"""
+Estate Sync Model
+================
+
+This module defines the delta synchronization of properties and offers used
+by the mobile agents' app (see controllers/sync.py). Instead of downloading
+the whole dataset, clients send the sync token of their previous call and
+only receive the records created, changed or deleted since then.
+
+Key Features:
+- Keyset pagination on (write_date, id), backed by a composite index
+- Tombstones recording deleted properties and offers
+- Compact payloads (many2one as ids, selected fields only)
+- Tombstone retention with forced resync of outdated tokens
+
+Technical Details:
+- Model Name: estate.sync.tombstone
+- Table Name: estate_sync_tombstone
+- Dependencies: estate.property, estate.property.offer
+"""
+
+from odoo import api, fields, models, exceptions, tools  # type: ignore
+from ..tools.instrumentation import instrumented
+from datetime import timedelta
+import base64
+import json
+
+# Synchronized resources: (model, compact fields)
+SYNC_RESOURCES = {
+    'properties': ('estate.property', [
+        'name', 'postcode', 'state', 'active', 'expected_price',
+        'selling_price', 'best_price', 'property_type_id', 'salesperson',
+        'tag_ids',
+    ]),
+    'offers': ('estate.property.offer', [
+        'property_id', 'partner_id', 'price', 'status', 'date_deadline',
+    ]),
+}
+SYNC_PAGE_SIZE = 500
+SYNC_MAX_PAGE_SIZE = 5000
+# Transactions commit after their write_date: the cursor of the last page
+# stays this far behind, so late commits are delivered on the next call.
+SYNC_SAFETY_MARGIN = timedelta(seconds=60)
+TOMBSTONE_RETENTION_DAYS = 30
+
+
+class EstateSyncTombstone(models.Model):
+    """
+    Estate Sync Tombstone Model
+
+    Records the deletion of a synchronized record.
+
+    Key Fields:
+    - res_model: Model of the deleted record
+    - res_id: Identifier of the deleted record
+    - create_date: Deletion time
+    """
+
+    _name = "estate.sync.tombstone"
+    _description = "Real Estate Sync Tombstone"
+    _order = "create_date, id"
+
+    res_model = fields.Char(required=True, index=True)
+    res_id = fields.Integer(required=True)
+
+    def init(self):
+        tools.create_index(
+            self._cr,
+            'estate_sync_tombstone_sync_index',
+            self._table,
+            ['res_model', 'create_date', 'id'],
+        )
+
+    @api.model
+    def _record(self, records):
+        """Creates the tombstones of records about to be deleted."""
+        if records:
+            self.sudo().create([
+                {'res_model': records._name, 'res_id': record_id}
+                for record_id in records.ids
+            ])
+
+    @api.model
+    def _record_cascade(self, model_name, column, parent_ids):
+        """
+        Creates with one INSERT ... SELECT the tombstones of the records of
+        model_name deleted by the ON DELETE CASCADE of their column foreign
+        key when the records parent_ids are deleted.
+        """
+        if not parent_ids:
+            return
+        Model = self.env[model_name]
+        Model.flush_model([column])
+        self.env.cr.execute(f"""
+            INSERT INTO {self._table}
+                   (res_model, res_id, create_uid, create_date,
+                    write_uid, write_date)
+            SELECT %s, id, %s, now() AT TIME ZONE 'UTC',
+                   %s, now() AT TIME ZONE 'UTC'
+              FROM {Model._table}
+             WHERE {column} IN %s
+        """, (model_name, self.env.uid, self.env.uid, tuple(parent_ids)))
+
+    @api.model
+    def _cron_purge(self):
+        """Deletes the tombstones older than the retention period."""
+        self.search([
+            ('create_date', '<', fields.Datetime.now() - timedelta(
+                days=TOMBSTONE_RETENTION_DAYS
+            )),
+        ]).unlink()
+
+    @api.model
+    @instrumented
+    def get_changes(self, resource, token=None, limit=SYNC_PAGE_SIZE):
+        """
+        Returns the changes of resource since token:
+        {'records': [...], 'deleted': [ids], 'token': next token,
+         'has_more': bool, 'reset': bool}
+
+        Without token (or with a token older than the tombstone retention,
+        in which case 'reset' is set) every record is sent.
+        """
+        if resource not in SYNC_RESOURCES:
+            raise exceptions.UserError(f"Unknown sync resource: {resource}")
+        model_name, field_names = SYNC_RESOURCES[resource]
+        Model = self.env[model_name].with_context(active_test=False)
+        Model.check_access_rights('read')
+        limit = min(max(int(limit or SYNC_PAGE_SIZE), 1), SYNC_MAX_PAGE_SIZE)
+
+        now = fields.Datetime.now()
+        state = _decode_token(token)
+        reset = bool(state) and state['issued'] < now - timedelta(
+            days=TOMBSTONE_RETENTION_DAYS
+        )
+        if not state or reset:
+            state = {'changed': None, 'deleted': self._latest_cursor(
+                model_name
+            )}
+
+        self.env.flush_all()
+        changed = self._fetch_page(
+            Model._table, 'write_date', None, state['changed'], limit
+        )
+        deleted = []
+        if state['deleted']:
+            deleted = self._fetch_page(
+                self._table, 'create_date', model_name, state['deleted'],
+                limit, select='res_id',
+            )
+
+        records = Model.browse([row[0] for row in changed])
+        records = records._filter_access_rules('read')
+        changed_cursor, changed_more = _next_cursor(
+            changed, state['changed'], len(changed) == limit, now
+        )
+        deleted_cursor, deleted_more = _next_cursor(
+            deleted, state['deleted'], len(deleted) == limit, now
+        )
+        return {
+            'records': records.read(field_names, load=None),
+            'deleted': [row[0] for row in deleted],
+            'token': _encode_token({
+                'changed': changed_cursor,
+                'deleted': deleted_cursor,
+                'issued': now,
+            }),
+            'has_more': changed_more or deleted_more,
+            'reset': reset,
+        }
+
+    def _latest_cursor(self, model_name):
+        """
+        Cursor after the last tombstone of model_name, never past
+        now - SYNC_SAFETY_MARGIN: tombstones of transactions still running
+        are delivered by the next calls.
+        """
+        self.env.cr.execute(f"""
+            SELECT create_date, id FROM {self._table}
+             WHERE res_model = %s
+          ORDER BY create_date DESC, id DESC
+             LIMIT 1
+        """, (model_name,))
+        row = self.env.cr.fetchone()
+        horizon = _horizon(fields.Datetime.now())
+        return min(list(row), horizon) if row else horizon
+
+    def _fetch_page(self, table, column, res_model, cursor, limit,
+                    select='id'):
+        """
+        Returns [(value, timestamp, id)] of the rows of table after cursor,
+        ordered by (column, id), using the composite index on those columns.
+        """
+        conditions, params = [], []
+        if res_model:
+            conditions.append("res_model = %s")
+            params.append(res_model)
+        if cursor:
+            conditions.append(f"({column}, id) > (%s, %s)")
+            params.extend(cursor)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        self.env.cr.execute(f"""
+            SELECT {select}, {column}, id FROM {table}
+            {where}
+            ORDER BY {column}, id
+            LIMIT %s
+        """, params + [limit])
+        return self.env.cr.fetchall()
+
+
+def _horizon(now):
+    """Latest cursor a sync token may hold at time now."""
+    return [now - SYNC_SAFETY_MARGIN, 0]
+
+
+def _next_cursor(rows, cursor, full, now):
+    """
+    Returns (cursor following the rows, whether to call again). The cursor
+    never goes past now - SYNC_SAFETY_MARGIN, so rows of transactions
+    still running are not skipped (rows after it are sent again, clients
+    upsert by id). A full page reaching the horizon ends the sync: the
+    next pages would start from the same horizon.
+    """
+    if not rows:
+        return cursor, False
+    last = [rows[-1][1], rows[-1][2]]
+    horizon = _horizon(now)
+    if last < horizon:
+        return last, full
+    return (max(cursor, horizon) if cursor else horizon), False
+
+
+def _encode_token(state):
+    payload = {
+        key: [value[0].isoformat(), value[1]] if isinstance(value, list)
+        else value.isoformat() if value else None
+        for key, value in state.items()
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_token(token):
+    if not token:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return {
+            'changed': _parse_cursor(payload.get('changed')),
+            'deleted': _parse_cursor(payload.get('deleted')),
+            'issued': fields.Datetime.to_datetime(payload['issued']),
+        }
+    except (KeyError, TypeError, ValueError) as error:
+        raise exceptions.UserError("Invalid sync token.") from error
+
+
+def _parse_cursor(value):
+    if not value:
+        return None
+    timestamp, record_id = value
+    return [fields.Datetime.to_datetime(timestamp), int(record_id)]
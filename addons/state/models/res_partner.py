@@ -0,0 +1,71 @@
+"""
+Inherited Partner Model
+=====================
+
+This module extends Odoo's contact model (res.partner) with the buying
+criteria of the real estate buyers, used with their past offers by the
+matching engine (estate.property.matching).
+
+Technical Details:
+- Inherits: res.partner (base contact model)
+- New Fields: buyer criteria (price range, minimum bedrooms and living
+  area, property types and tags)
+- Action: matching properties of the buyer
+"""
+
+from odoo import fields, models  # type: ignore
+
+# Number of properties opened by the matching button
+MATCHING_ACTION_LIMIT = 20
+
+
+class InheritedResPartner(models.Model):
+    """
+    Extended Partner Model for Real Estate Buyers
+
+    Key Extensions:
+    - Stated buying criteria, applied as hard filters by the matching
+    - Quick access to the properties matching the buyer
+    """
+
+    _inherit = "res.partner"
+
+    buyer_min_price = fields.Float(string="Minimum Price")
+    buyer_max_price = fields.Float(string="Maximum Price")
+    buyer_min_bedrooms = fields.Integer(string="Minimum Bedrooms")
+    buyer_min_living_area = fields.Integer(
+        string="Minimum Living Area (sqm)"
+    )
+    buyer_property_type_ids = fields.Many2many(
+        "estate.property.type",
+        "res_partner_estate_property_type_rel",
+        "partner_id",
+        "type_id",
+        string="Wanted Property Types",
+    )
+    buyer_tag_ids = fields.Many2many(
+        "estate.property.tag",
+        "res_partner_estate_property_tag_rel",
+        "partner_id",
+        "tag_id",
+        string="Wanted Tags",
+    )
+
+    def action_view_matching_properties(self):
+        """
+        Opens the available properties best matching the buyer, ranked
+        by similarity unless the user sorts the view otherwise.
+        """
+        self.ensure_one()
+        matches = self.env["estate.property.matching"].match(
+            self, limit=MATCHING_ACTION_LIMIT
+        )[self.id]
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "state.action_estate_property"
+        )
+        ranking = [property_id for property_id, _score in matches]
+        action["name"] = "Matching Properties"
+        action["domain"] = [("id", "in", ranking)]
+        # Best matches first (see estate.property.search_fetch)
+        action["context"] = {"estate_match_ranking": ranking}
+        return action
@@ -10,9 +10,11 @@ Technical Details:
 - Inherits: res.users (base user model)
 - New Fields: property_ids (One2many to estate.property)
 - Domain Filter: Only shows properties in 'new' or 'offer_received' states
+- Dashboard Counters: active listings, pending offers, expected value and
+  sales of the month, computed with one grouped query per batch of users
 """
 
-from odoo import fields, models  # type: ignore
+from odoo import api, fields, models  # type: ignore
 
 
 class InheritedResUser(models.Model):
@@ -27,6 +29,7 @@ class InheritedResUser(models.Model):
     - Links properties to users (salespeople)
     - Filters properties by state
     - Provides quick access to assigned properties
+    - Computes dashboard counters without loading the properties
     """
 
     _inherit = "res.users"  # Inherits the base user model
@@ -41,3 +44,95 @@ class InheritedResUser(models.Model):
             # Only show active properties
         ],
     )
+
+    # Dashboard Counters
+    property_active_count = fields.Integer(
+        string="Active Listings",
+        compute="_compute_property_dashboard",
+        help="Properties in 'new' or 'offer_received' state"
+    )
+    property_offer_pending_count = fields.Integer(
+        string="Offers Pending",
+        compute="_compute_property_dashboard",
+        help="Offers neither accepted nor refused on active listings"
+    )
+    property_expected_total = fields.Float(
+        string="Expected Value",
+        compute="_compute_property_dashboard",
+        help="Sum of the expected prices of the active listings"
+    )
+    property_sold_month_count = fields.Integer(
+        string="Sold This Month",
+        compute="_compute_property_dashboard",
+        help="Properties sold since the first day of the current month"
+    )
+
+    @api.depends(
+        "property_ids.state",
+        "property_ids.expected_price",
+        "property_ids.offer_ids.status",
+    )
+    def _compute_property_dashboard(self):
+        """
+        Computes the dashboard counters of the whole batch of users with a
+        single grouped query. The pending offers are counted per active
+        property with a LATERAL subquery on the property_id index, instead
+        of aggregating every pending offer of the database first.
+
+        The fields are not stored: the values are only cached for the
+        current transaction, every request runs the query again.
+        """
+        data = {}
+        user_ids = self.filtered("id").ids
+        if user_ids:
+            self.env["estate.property"].flush_model([
+                "salesperson", "state", "expected_price", "date_sold",
+                "active",
+            ])
+            self.env["estate.property.offer"].flush_model([
+                "property_id", "status",
+            ])
+            month_start = fields.Date.today().replace(day=1)
+            self.env.cr.execute("""
+                SELECT p.salesperson,
+                       COUNT(*) FILTER (WHERE p.state IN %(active)s),
+                       COALESCE(SUM(o.pending), 0),
+                       COALESCE(SUM(p.expected_price)
+                                FILTER (WHERE p.state IN %(active)s), 0),
+                       COUNT(*) FILTER (WHERE p.state = 'sold'
+                                        AND p.date_sold >= %(month_start)s)
+                  FROM estate_property p
+             LEFT JOIN LATERAL (
+                       SELECT COUNT(*) AS pending
+                         FROM estate_property_offer
+                        WHERE property_id = p.id
+                          AND status IS NULL
+                          AND p.state IN %(active)s
+                   ) o ON true
+                 WHERE p.salesperson IN %(user_ids)s
+                   AND p.active
+              GROUP BY p.salesperson
+            """, {
+                "active": ("new", "offer_received"),
+                "month_start": month_start,
+                "user_ids": tuple(user_ids),
+            })
+            data = {row[0]: row[1:] for row in self.env.cr.fetchall()}
+        for user in self:
+            active, pending, expected, sold = data.get(user.id, (0, 0, 0, 0))
+            user.property_active_count = active
+            user.property_offer_pending_count = pending
+            user.property_expected_total = expected
+            user.property_sold_month_count = sold
+
+    def action_view_properties(self):
+        """Opens the active listings of the salesperson."""
+        self.ensure_one()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "state.action_estate_property"
+        )
+        action["domain"] = [
+            ("salesperson", "=", self.id),
+            ("state", "in", ["new", "offer_received"]),
+        ]
+        return action
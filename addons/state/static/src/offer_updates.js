@@ -0,0 +1,35 @@
+/** @odoo-module **/
+
+import { onWillUnmount } from "@odoo/owl";
+import { useService } from "@web/core/utils/hooks";
+
+/**
+ * Bus notification sent by estate.property.offer when offers are created,
+ * accepted or refused. One message per property:
+ * { property_id, state, best_price, offer_ids }
+ */
+export const OFFER_NOTIFICATION_TYPE = "state.offer_updated";
+
+/**
+ * Calls onUpdate with the set of updated property ids each time offer
+ * notifications are received, for as long as the component is mounted.
+ * Notifications received together are handled in a single call.
+ * @param {Function} onUpdate - Callback receiving a Set of property ids
+ */
+export function useOfferUpdates(onUpdate) {
+    const busService = useService("bus_service");
+    let pending = null;
+    const callback = ({ property_id }) => {
+        if (!pending) {
+            pending = new Set();
+            Promise.resolve().then(() => {
+                const propertyIds = pending;
+                pending = null;
+                onUpdate(propertyIds);
+            });
+        }
+        pending.add(property_id);
+    };
+    busService.subscribe(OFFER_NOTIFICATION_TYPE, callback);
+    onWillUnmount(() => busService.unsubscribe(OFFER_NOTIFICATION_TYPE, callback));
+}
@@ -0,0 +1,58 @@
+/** @odoo-module **/
+
+import { registry } from "@web/core/registry";
+import { formView } from "@web/views/form/form_view";
+import { FormController } from "@web/views/form/form_controller";
+import { kanbanView } from "@web/views/kanban/kanban_view";
+import { KanbanController } from "@web/views/kanban/kanban_controller";
+import { useOfferUpdates } from "../offer_updates";
+
+/**
+ * Property Form Controller
+ * Reloads the displayed property when its offers change, unless it has
+ * unsaved changes
+ */
+export class EstatePropertyFormController extends FormController {
+    setup() {
+        super.setup();
+        useOfferUpdates(async (propertyIds) => {
+            const record = this.model.root;
+            if (!propertyIds.has(record.resId) || (await record.isDirty())) {
+                return;
+            }
+            await record.load();
+        });
+    }
+}
+
+/**
+ * Property Kanban Controller
+ * Reloads only the cards of the properties whose offers changed, instead
+ * of re-fetching the whole view
+ */
+export class EstatePropertyKanbanController extends KanbanController {
+    setup() {
+        super.setup();
+        useOfferUpdates(async (propertyIds) => {
+            const root = this.model.root;
+            const records = root.isGrouped
+                ? root.groups.flatMap((group) => group.list.records)
+                : root.records;
+            await Promise.all(
+                records
+                    .filter((record) => propertyIds.has(record.resId))
+                    .map((record) => record.load())
+            );
+        });
+    }
+}
+
+registry.category("views").add("estate_property_form", {
+    ...formView,
+    Controller: EstatePropertyFormController,
+});
+
+registry.category("views").add("estate_property_kanban", {
+    ...kanbanView,
+    Controller: EstatePropertyKanbanController,
+});
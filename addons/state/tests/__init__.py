@@ -0,0 +1,3 @@
+from . import test_query_plans  # noqa: F401
+from . import test_benchmark  # noqa: F401
+from . import test_concurrent_bids  # noqa: F401
@@ -0,0 +1,174 @@
+"""
+Benchmark Tests
+==============
+
+Query budgets and timings of the hot operations of the real estate module,
+measured on a seeded dataset with the helpers of tools/benchmark.py.
+
+Every operation runs on a small and a SCALE times larger batch: the query
+count must stay within its budget and must not grow with the batch size
+(no N+1 queries). Timings depend on the machine running the tests, so the
+time per record is only reported (logged and written with the results),
+never asserted.
+The measurements are written as JSON to the file named by the
+STATE_BENCHMARK_OUTPUT environment variable (state_benchmark.json in the
+temporary directory by default).
+"""
+
+from odoo.tests import TransactionCase, tagged  # type: ignore
+from odoo.addons.state.models.estate_property import (  # type: ignore
+    EstateProperty,
+)
+from odoo.addons.state.tools import benchmark  # type: ignore
+from odoo.addons.state.tools.instrumentation import (  # type: ignore
+    SAMPLE_RATE_PARAM,
+)
+import logging
+import os
+import tempfile
+
+_logger = logging.getLogger(__name__)
+
+SMALL_BATCH = 10
+SCALE = 4
+# Extra queries tolerated on the large batch
+SCALING_SLACK = 3
+
+# Maximum number of queries of an operation, whatever the batch size
+QUERY_BUDGETS = {
+    'offer_create': 30,
+    'action_accepted': 30,
+    'action_sold': 20,
+    'kanban_web_search_read': 12,
+    'type_counters': 4,
+    'unlink': 30,
+}
+
+
+@tagged('post_install', '-at_install')
+class TestBenchmark(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Instrumentation samples would add queries to random calls
+        cls.env['ir.config_parameter'].sudo().set_param(
+            SAMPLE_RATE_PARAM, '0'
+        )
+        cls.dataset = benchmark.generate_dataset(
+            cls.env,
+            properties=SMALL_BATCH * (1 + SCALE),
+            types=SMALL_BATCH * (1 + SCALE),
+            offers_per_property=3,
+        )
+        cls.results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        path = os.environ.get('STATE_BENCHMARK_OUTPUT') or os.path.join(
+            tempfile.gettempdir(), 'state_benchmark.json'
+        )
+        with open(path, 'w', encoding='utf-8') as output:
+            output.write(benchmark.to_json({'results': cls.results}))
+        _logger.info("Benchmark results written to %s", path)
+        super().tearDownClass()
+
+    def assertBudget(self, name, make_batch, operation):
+        """
+        Measures operation on a batch of SMALL_BATCH records, then on a
+        batch of SMALL_BATCH * SCALE records (make_batch(offset, size)
+        returns the batch) and checks the query budget of name.
+        """
+        measures = []
+        offset = 0
+        for size in (SMALL_BATCH, SMALL_BATCH * SCALE):
+            batch = make_batch(offset, size)
+            offset += size
+            with benchmark.measure(self.env, measures, name, size):
+                operation(batch)
+        self.results.extend(measures)
+        small, large = measures
+        self.assertLessEqual(
+            large['queries'], QUERY_BUDGETS[name],
+            f"{name}: {large['queries']} queries for {large['records']} "
+            "records"
+        )
+        self.assertLessEqual(
+            large['queries'], small['queries'] + SCALING_SLACK,
+            f"{name}: the query count grows with the batch size "
+            f"({small['queries']} then {large['queries']})"
+        )
+        _logger.info(
+            "Benchmark %s: %s queries, %s ms per record (%s records)",
+            name, large['queries'], large['ms_per_record'],
+            large['records']
+        )
+
+    def _properties(self, offset, size):
+        return self.dataset['properties'][offset:offset + size]
+
+    def _offer_vals(self, properties):
+        partners = self.dataset['partners']
+        return [{
+            'property_id': record.id,
+            'partner_id': partners[index % len(partners)].id,
+            'price': round(
+                max(record.best_price, record.expected_price) * 1.05, 2
+            ),
+        } for index, record in enumerate(properties)]
+
+    def test_offer_create(self):
+        Offer = self.env['estate.property.offer']
+        self.assertBudget(
+            'offer_create',
+            lambda offset, size: self._offer_vals(
+                self._properties(offset, size)
+            ),
+            Offer.create,
+        )
+
+    def test_action_accepted(self):
+        Offer = self.env['estate.property.offer']
+        self.assertBudget(
+            'action_accepted',
+            lambda offset, size: Offer.create(
+                self._offer_vals(self._properties(offset, size))
+            ),
+            lambda offers: offers.action_accepted(),
+        )
+
+    def test_action_sold(self):
+        # Base implementation: invoicing overrides have their own budgets
+        self.assertBudget(
+            'action_sold', self._properties, EstateProperty.action_sold
+        )
+
+    def test_kanban_web_search_read(self):
+        Property = self.env['estate.property']
+        domain = [('state', 'in', ['new', 'offer_received'])]
+        self.assertBudget(
+            'kanban_web_search_read',
+            lambda offset, size: size,
+            lambda limit: Property.web_search_read(
+                domain, benchmark.KANBAN_SPECIFICATION, limit=limit
+            ),
+        )
+
+    def test_type_counters(self):
+        types = self.dataset['types']
+        self.assertBudget(
+            'type_counters',
+            lambda offset, size: types[offset:offset + size],
+            lambda batch: batch.read(['offer_count', 'property_count']),
+        )
+
+    def test_unlink(self):
+        Property = self.env['estate.property']
+        self.assertBudget(
+            'unlink',
+            lambda offset, size: Property.create([{
+                'name': f'Benchmark Unlink {offset + index}',
+                'expected_price': 100000.0,
+            } for index in range(size)]),
+            lambda properties: properties.unlink(),
+        )
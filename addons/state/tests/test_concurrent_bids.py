@@ -0,0 +1,51 @@
+"""
+Concurrent Bidding Tests
+=======================
+
+Races several cursors placing bids on one property with
+run_concurrent_bids (tools/benchmark.py) and checks the outcome.
+
+The benchmark commits its own partner, property and offers through
+separate connections (and deletes them afterwards), so it is left out of
+the standard test suite. Run it explicitly:
+
+    odoo-bin -d test_db -i state --test-enable \
+        --test-tags state_concurrency --stop-after-init
+"""
+
+from odoo.tests import TransactionCase, tagged  # type: ignore
+from odoo.addons.state.tools import benchmark  # type: ignore
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Threads racing on the property, and bids placed by each of them
+BID_WORKERS = 4
+BIDS_PER_WORKER = 10
+
+
+@tagged('-standard', 'state_concurrency', 'post_install', '-at_install')
+class TestConcurrentBids(TransactionCase):
+
+    def test_concurrent_bids(self):
+        result = benchmark.run_concurrent_bids(
+            self.env, workers=BID_WORKERS, bids_per_worker=BIDS_PER_WORKER
+        )
+        _logger.info(
+            "Concurrent bids: %s accepted, %s retries, %s failed, "
+            "%s bids/s",
+            result['accepted'], result['retries'], result['failed'],
+            result['bids_per_second']
+        )
+        self.assertTrue(result['consistent'], result)
+        self.assertGreater(result['accepted'], 0, result)
+        self.assertEqual(
+            result['accepted'] + result['rejected'] + result['failed'],
+            result['bids'], result
+        )
+        # A committed bid aborts at most the other workers waiting on the
+        # property lock: more retries would mean cascading failures
+        self.assertLessEqual(
+            result['retries'], result['accepted'] * (BID_WORKERS - 1),
+            result
+        )
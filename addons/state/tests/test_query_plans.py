@@ -0,0 +1,40 @@
+"""
+Query Plan Tests
+===============
+
+Checks with EXPLAIN, on a seeded dataset, that the hot queries of the real
+estate module are served by the indexes it creates (see PLAN_CHECKS in
+tools/benchmark.py).
+"""
+
+from odoo.tests import TransactionCase, tagged  # type: ignore
+from odoo.addons.state.tools import benchmark  # type: ignore
+
+
+@tagged('post_install', '-at_install')
+class TestQueryPlans(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dataset = benchmark.generate_dataset(
+            cls.env, properties=300, offers_per_property=2
+        )
+        cls.env.cr.execute("ANALYZE estate_property")
+        cls.env.cr.execute("ANALYZE estate_property_offer")
+
+    def test_indexes_used(self):
+        plans = benchmark.check_query_plans(self.env, self.dataset)
+        self.assertEqual(
+            {plan['name'] for plan in plans},
+            {check[0] for check in benchmark.PLAN_CHECKS},
+        )
+        for plan in plans:
+            if plan['skipped']:
+                continue
+            with self.subTest(query=plan['name']):
+                self.assertTrue(
+                    plan['uses_index'],
+                    f"{plan['index']} is not used by {plan['name']}:\n"
+                    f"{plan['plan']}"
+                )
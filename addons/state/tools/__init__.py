@@ -0,0 +1,2 @@
+# Tools are imported explicitly by the models (instrumentation) or from an
+# odoo shell (benchmark); the package does not import them itself.
@@ -0,0 +1,545 @@
+"""
+Estate Benchmark
+===============
+
+This module provides a reproducible performance benchmark for the real
+estate models. It seeds a synthetic dataset with realistic distributions and
+measures wall time and SQL query count of the hot operations.
+
+Key Features:
+- Seeded dataset generator (types, tags, partners, properties, offers)
+- Timing and query counting of offer creation, offer acceptance,
+  action_sold (with and without estate_account), kanban loading,
+  property type counters, text searches and unlink validation
+- EXPLAIN checks of the module indexes
+- Concurrent bidding: parallel cursors racing on one property
+- Machine-readable (JSON) results
+
+The query budgets of these operations are asserted by the post_install
+tests of tests/test_benchmark.py (timings are only reported), and the
+index plans by tests/test_query_plans.py.
+
+Usage (from an odoo shell, the transaction is never committed):
+    from odoo.addons.state.tools import benchmark
+    results = benchmark.run(env, properties=2000)
+    print(benchmark.to_json(results))
+    env.cr.rollback()
+
+The concurrent bidding benchmark needs committed data visible to several
+cursors: it commits its own property and offers, then deletes them.
+    print(benchmark.to_json(benchmark.run_concurrent_bids(env)))
+"""
+
+from contextlib import contextmanager
+from datetime import timedelta
+from odoo import api, exceptions, fields, Command  # type: ignore
+from odoo.service.model import (  # type: ignore
+    PG_CONCURRENCY_ERRORS_TO_RETRY,
+)
+from odoo.addons.state.models.estate_property import (  # type: ignore
+    EstateProperty,
+)
+import json
+import psycopg2
+import random
+import threading
+import time
+
+DEFAULT_SEED = 42
+
+POSTCODE_COUNT = 200
+PARTNER_COUNT = 50
+# Attempts per bid before giving up, as the server retries requests
+BID_MAX_TRIES = 5
+
+KANBAN_SPECIFICATION = {
+    'name': {},
+    'state': {},
+    'expected_price': {},
+    'best_price': {},
+    'selling_price': {},
+    'tag_ids': {'fields': {'display_name': {}, 'color': {}}},
+}
+
+# (name, index expected in the plan, query, params)
+PLAN_CHECKS = [
+    (
+        'available_properties',
+        'estate_property_available_index',
+        "SELECT id FROM estate_property WHERE active "
+        "AND state IN ('new', 'offer_received') ORDER BY id DESC LIMIT 80",
+        (),
+    ),
+    (
+        'salesperson_pipeline',
+        'estate_property_pipeline_index',
+        "SELECT id FROM estate_property WHERE salesperson = %s AND active "
+        "AND state IN ('new', 'offer_received')",
+        ('uid',),
+    ),
+    (
+        'property_offers',
+        'estate_property_offer_property_price_index',
+        "SELECT id FROM estate_property_offer WHERE property_id = %s "
+        "ORDER BY price DESC",
+        ('property_id',),
+    ),
+    (
+        'name_fragment_search',
+        'estate_property__name_index',
+        "SELECT id FROM estate_property WHERE name ILIKE %s",
+        ('fragment',),
+    ),
+    (
+        'description_fragment_search',
+        'estate_property__description_index',
+        "SELECT id FROM estate_property WHERE description ILIKE %s",
+        ('description_fragment',),
+    ),
+    (
+        'postcode_fragment_search',
+        'estate_property__postcode_index',
+        "SELECT id FROM estate_property WHERE postcode ILIKE %s",
+        ('postcode_fragment',),
+    ),
+    (
+        'property_sync_page',
+        'estate_property_write_date_index',
+        "SELECT id, write_date FROM estate_property "
+        "WHERE (write_date, id) > (%s, %s) ORDER BY write_date, id LIMIT 500",
+        ('sync_date', 'sync_id'),
+    ),
+    (
+        'offer_sync_page',
+        'estate_property_offer_write_date_index',
+        "SELECT id, write_date FROM estate_property_offer "
+        "WHERE (write_date, id) > (%s, %s) ORDER BY write_date, id LIMIT 500",
+        ('sync_date', 'sync_id'),
+    ),
+    (
+        'tombstone_sync_page',
+        'estate_sync_tombstone_sync_index',
+        "SELECT res_id, create_date, id FROM estate_sync_tombstone "
+        "WHERE res_model = %s AND (create_date, id) > (%s, %s) "
+        "ORDER BY create_date, id LIMIT 500",
+        ('sync_model', 'sync_date', 'sync_id'),
+    ),
+    (
+        'fulltext_search',
+        'estate_property_fulltext_index',
+        "SELECT id FROM estate_property WHERE to_tsvector('simple', "
+        "coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || "
+        "coalesce(postcode, '')) @@ plainto_tsquery('simple', %s)",
+        ('word',),
+    ),
+]
+
+
+@contextmanager
+def measure(env, results, name, records=0):
+    """
+    Context manager recording the wall time and the number of SQL queries
+    of the enclosed block, pending ORM writes included.
+    """
+    env.flush_all()
+    env.invalidate_all()
+    queries = env.cr.sql_log_count
+    start = time.perf_counter()
+    yield
+    env.flush_all()
+    elapsed = time.perf_counter() - start
+    results.append({
+        'name': name,
+        'records': records,
+        'queries': env.cr.sql_log_count - queries,
+        'seconds': round(elapsed, 6),
+        'ms_per_record': (
+            round(elapsed * 1000 / records, 4) if records else None
+        ),
+    })
+
+
+def generate_dataset(env, properties=1000, types=10, tags=20,
+                     offers_per_property=4, seed=DEFAULT_SEED):
+    """
+    Creates a synthetic dataset and returns its records in a dict.
+
+    Property types follow a skewed (Zipf-like) distribution, prices are
+    log-normal, and each property receives between 0 and
+    2 * offers_per_property ascending offers around its expected price.
+    """
+    rng = random.Random(seed)
+    Type = env['estate.property.type']
+    Tag = env['estate.property.tag']
+
+    type_names = [f'Benchmark Type {seed}-{i}' for i in range(types)]
+    type_records = Type.search([('name', 'in', type_names)])
+    missing = set(type_names) - set(type_records.mapped('name'))
+    type_records |= Type.create([{'name': name} for name in sorted(missing)])
+
+    tag_names = [f'Benchmark Tag {seed}-{i}' for i in range(tags)]
+    tag_records = Tag.search([('name', 'in', tag_names)])
+    missing = set(tag_names) - set(tag_records.mapped('name'))
+    tag_records |= Tag.create([
+        {'name': name, 'color': rng.randint(0, 11)}
+        for name in sorted(missing)
+    ])
+
+    partners = env['res.partner'].create([
+        {'name': f'Benchmark Buyer {seed}-{i}'} for i in range(PARTNER_COUNT)
+    ])
+    postcodes = [f'{rng.randint(1000, 99999):05d}' for _ in range(
+        POSTCODE_COUNT
+    )]
+    type_weights = [1 / (rank + 1) for rank in range(len(type_records))]
+
+    property_vals = []
+    for i in range(properties):
+        garden = rng.random() < 0.4
+        property_vals.append({
+            'name': f'Benchmark Property {seed}-{i}',
+            'description': f'Synthetic listing {i} generated for benchmarks',
+            'postcode': rng.choice(postcodes),
+            'expected_price': round(rng.lognormvariate(12.5, 0.4), 2),
+            'bedrooms': rng.choices(
+                [1, 2, 3, 4, 5, 6], weights=[10, 30, 30, 18, 8, 4]
+            )[0],
+            'living_area': max(int(rng.gauss(110, 40)), 20),
+            'facades': rng.randint(1, 4),
+            'garage': rng.random() < 0.5,
+            'garden': garden,
+            'garden_area': rng.randint(10, 500) if garden else 0,
+            'garden_orientation': (
+                rng.choice(['north', 'south', 'east', 'west'])
+                if garden else False
+            ),
+            'property_type_id': rng.choices(
+                type_records.ids, weights=type_weights
+            )[0],
+            'tag_ids': [
+                Command.set(rng.sample(tag_records.ids, rng.randint(0, 3)))
+            ],
+        })
+    property_records = env['estate.property'].create(property_vals)
+
+    offer_vals = []
+    for record in property_records:
+        price = record.expected_price * rng.uniform(0.9, 1.0)
+        for _offer in range(rng.randint(0, 2 * offers_per_property)):
+            price = round(price * rng.uniform(1.0, 1.05), 2)
+            offer_vals.append({
+                'property_id': record.id,
+                'partner_id': rng.choice(partners.ids),
+                'price': price,
+                'validity': rng.randint(1, 30),
+            })
+    offer_records = env['estate.property.offer'].create(offer_vals)
+
+    return {
+        'types': type_records,
+        'tags': tag_records,
+        'partners': partners,
+        'properties': property_records,
+        'offers': offer_records,
+    }
+
+
+# Checks of the index='trigram' fields, whose indexes the ORM only creates
+# when pg_trgm is available
+TRIGRAM_CHECKS = {
+    'name_fragment_search', 'description_fragment_search',
+    'postcode_fragment_search',
+}
+
+
+def check_query_plans(env, dataset):
+    """
+    Runs EXPLAIN on the hot queries with sequential scans disabled and
+    reports whether the expected index is used by the plan. Trigram checks
+    are reported as skipped when pg_trgm is not available.
+    """
+    env.flush_all()
+    cr = env.cr
+    values = {
+        'uid': env.uid,
+        'property_id': dataset['properties'][:1].id or 0,
+        'fragment': '%roperty 4%',
+        'description_fragment': '%ing 7%',
+        'postcode_fragment': '%123%',
+        'sync_model': 'estate.property',
+        'sync_date': fields.Datetime.now() - timedelta(days=1),
+        'sync_id': 0,
+        'word': 'synthetic',
+    }
+    plans = []
+    cr.execute("SET enable_seqscan = off")
+    try:
+        for name, index, query, params in PLAN_CHECKS:
+            if name in TRIGRAM_CHECKS and not env.registry.has_trigram:
+                plans.append({
+                    'name': name,
+                    'index': index,
+                    'uses_index': None,
+                    'skipped': True,
+                    'plan': '',
+                })
+                continue
+            cr.execute(
+                "EXPLAIN " + query, tuple(values[key] for key in params)
+            )
+            plan = "\n".join(row[0] for row in cr.fetchall())
+            plans.append({
+                'name': name,
+                'index': index,
+                'uses_index': index in plan,
+                'skipped': False,
+                'plan': plan,
+            })
+    finally:
+        cr.execute("RESET enable_seqscan")
+    return plans
+
+
+def run(env, properties=1000, offers_per_property=4, sample=200,
+        seed=DEFAULT_SEED):
+    """
+    Seeds a dataset and benchmarks the hot operations on it.
+
+    :param sample: number of properties used by the per-operation benchmarks
+    :return: dict with the run parameters, the measurements and the plans
+    """
+    rng = random.Random(seed)
+    results = []
+    Property = env['estate.property']
+    Offer = env['estate.property.offer']
+
+    start = time.perf_counter()
+    dataset = generate_dataset(
+        env, properties=properties, offers_per_property=offers_per_property,
+        seed=seed,
+    )
+    generation_seconds = round(time.perf_counter() - start, 6)
+    records = dataset['properties']
+    sample_records = records.browse(
+        rng.sample(records.ids, min(sample, len(records)))
+    )
+
+    # Offer creation: one higher offer per sampled property
+    offer_vals = [{
+        'property_id': record.id,
+        'partner_id': rng.choice(dataset['partners'].ids),
+        'price': round(
+            max(record.best_price, record.expected_price) * 1.05, 2
+        ),
+    } for record in sample_records]
+    with measure(env, results, 'offer_create', len(offer_vals)):
+        new_offers = Offer.create(offer_vals)
+
+    # Offer acceptance: the new offer of each sampled property
+    with measure(env, results, 'action_accepted', len(new_offers)):
+        new_offers.action_accepted()
+
+    # action_sold, with the base implementation and with every override
+    half = len(sample_records) // 2
+    base_batch, full_batch = sample_records[:half], sample_records[half:]
+    with measure(env, results, 'action_sold_base', len(base_batch)):
+        EstateProperty.action_sold(base_batch)
+    name = 'action_sold_estate_account' if 'account.move' in env else (
+        'action_sold'
+    )
+    with measure(env, results, name, len(full_batch)):
+        full_batch.action_sold()
+
+    # Kanban loading: grouped columns and first page of cards
+    domain = [('state', 'in', ['new', 'offer_received'])]
+    with measure(env, results, 'kanban_web_read_group'):
+        Property.web_read_group(
+            domain, ['expected_price:sum'], ['property_type_id'], lazy=True
+        )
+    with measure(env, results, 'kanban_web_search_read', 80):
+        Property.web_search_read(
+            domain, KANBAN_SPECIFICATION, limit=80
+        )
+
+    # Property type counters, as rendered by the list and stat button
+    with measure(env, results, 'type_offer_count', len(dataset['types'])):
+        dataset['types'].read(['offer_count', 'property_count'])
+
+    # Text searches: ilike fragments (trigram) and ranked full text
+    for name, domain in [
+        ('search_name_fragment', [('name', 'ilike', 'roperty 4')]),
+        ('search_postcode_fragment', [('postcode', 'ilike', '12')]),
+        ('search_description_fragment', [('description', 'ilike', 'ing 7')]),
+    ]:
+        with measure(env, results, name, 80):
+            Property.search(domain, limit=80)
+    with measure(env, results, 'search_fulltext_ranked', 80):
+        Property.search_fulltext('synthetic listing', limit=80)
+
+    # Unlink validation: rejected batch, then deletion of new properties
+    with measure(env, results, 'unlink_rejected', len(sample_records)):
+        try:
+            sample_records.unlink()
+        except exceptions.UserError:
+            pass
+    new_records = Property.create([{
+        'name': f'Benchmark Unlink {seed}-{i}',
+        'expected_price': 100000.0,
+    } for i in range(len(sample_records))])
+    with measure(env, results, 'unlink', len(new_records)):
+        new_records.unlink()
+
+    return {
+        'parameters': {
+            'properties': properties,
+            'offers_per_property': offers_per_property,
+            'sample': len(sample_records),
+            'seed': seed,
+            'offers': len(dataset['offers']),
+            'generation_seconds': generation_seconds,
+        },
+        'results': results,
+        'plans': check_query_plans(env, dataset),
+    }
+
+
+def _bid(registry, uid, property_id, partner_id, increment, stats, lock):
+    """
+    Places one bid above the current best offer in its own transaction,
+    retrying on concurrency errors like the server does for requests.
+    """
+    for attempt in range(1, BID_MAX_TRIES + 1):
+        try:
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, {})
+                record = env['estate.property'].browse(property_id)
+                env['estate.property.offer'].create({
+                    'property_id': property_id,
+                    'partner_id': partner_id,
+                    'price': round(
+                        max(record.best_price, record.expected_price)
+                        + increment, 2
+                    ),
+                })
+        except psycopg2.OperationalError as error:
+            if error.pgcode not in PG_CONCURRENCY_ERRORS_TO_RETRY:
+                raise
+            with lock:
+                stats['retries'] += 1
+            time.sleep(random.uniform(0, 0.005 * 2 ** attempt))
+            continue
+        except exceptions.UserError:
+            with lock:
+                stats['rejected'] += 1
+            return
+        with lock:
+            stats['accepted'] += 1
+        return
+    with lock:
+        stats['failed'] += 1
+
+
+def run_concurrent_bids(env, workers=8, bids_per_worker=25,
+                        seed=DEFAULT_SEED):
+    """
+    Races workers threads, each with its own cursor, placing
+    bids_per_worker increasing bids on the same property.
+
+    Reports the throughput (accepted bids per second), the number of
+    retried transactions, and checks the outcome: offers must be
+    increasing in creation order and the stored best price must be the
+    highest offer. The benchmark data is committed, then always deleted
+    (see _delete_bidding_data). The property has no salesperson, so the
+    bids send no bus notification.
+    """
+    registry = env.registry
+    with registry.cursor() as cr:
+        setup_env = api.Environment(cr, env.uid, {})
+        partner = setup_env['res.partner'].create({
+            'name': f'Benchmark Bidder {seed}',
+        })
+        record = setup_env['estate.property'].create({
+            'name': f'Benchmark Bidding War {seed}',
+            'expected_price': 100000.0,
+            'salesperson': False,
+        })
+        property_id, partner_id = record.id, partner.id
+
+    try:
+        stats = {'accepted': 0, 'rejected': 0, 'retries': 0, 'failed': 0}
+        lock = threading.Lock()
+        barrier = threading.Barrier(workers)
+
+        def worker(index):
+            rng = random.Random(seed + index)
+            barrier.wait()
+            for _bid_number in range(bids_per_worker):
+                _bid(registry, env.uid, property_id, partner_id,
+                     rng.randint(100, 1000), stats, lock)
+
+        threads = [
+            threading.Thread(target=worker, args=(index,))
+            for index in range(workers)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        with registry.cursor() as cr:
+            cr.execute("""
+                SELECT price FROM estate_property_offer
+                 WHERE property_id = %s
+              ORDER BY id
+            """, (property_id,))
+            prices = [row[0] for row in cr.fetchall()]
+            record = api.Environment(cr, env.uid, {})[
+                'estate.property'
+            ].browse(property_id)
+            consistent = (
+                all(low <= high for low, high in zip(prices, prices[1:]))
+                and record.best_price == max(prices, default=0.0)
+                and len(prices) == stats['accepted']
+            )
+    finally:
+        _delete_bidding_data(registry, env.uid, property_id, partner_id)
+
+    return dict(
+        stats,
+        workers=workers,
+        bids=workers * bids_per_worker,
+        seconds=round(elapsed, 6),
+        bids_per_second=(
+            round(stats['accepted'] / elapsed, 2) if elapsed else None
+        ),
+        consistent=consistent,
+    )
+
+
+def _delete_bidding_data(registry, uid, property_id, partner_id):
+    """
+    Deletes the committed data of run_concurrent_bids, and the sync
+    tombstones their deletion records: they never existed for clients.
+    """
+    with registry.cursor() as cr:
+        cleanup_env = api.Environment(cr, uid, {})
+        record = cleanup_env['estate.property'].browse(property_id).exists()
+        offer_ids = record.offer_ids.ids
+        if record:
+            record.write({'state': 'canceled'})
+            record.unlink()
+        cleanup_env['res.partner'].browse(partner_id).exists().unlink()
+        cleanup_env.flush_all()
+        cr.execute("""
+            DELETE FROM estate_sync_tombstone
+             WHERE (res_model = 'estate.property' AND res_id = %s)
+                OR (res_model = 'estate.property.offer'
+                    AND res_id = ANY(%s))
+        """, (property_id, offer_ids))
+
+
+def to_json(results):
+    """Serializes the output of run() as indented JSON."""
+    return json.dumps(results, indent=2, sort_keys=True)
@@ -0,0 +1,111 @@
+"""
+Estate Instrumentation
+=====================
+
+This module provides a lightweight, sampled instrumentation layer for the
+real estate models. Decorated methods record their wall time, SQL query
+count and number of processed records.
+
+Key Features:
+- @instrumented decorator usable on actions, computes, constraints and
+  create overrides
+- Sampling rate read from the state.instrumentation_sample_rate system
+  parameter (0 disables, 1 records every call)
+- Per-call log lines on this module's logger
+- Per-process aggregated statistics, shown by estate.performance.stat
+
+Technical Details:
+- Statistics live in memory and are kept per database and per worker
+"""
+
+from odoo import models  # type: ignore
+import functools
+import logging
+import random
+import threading
+import time
+
+_logger = logging.getLogger(__name__)
+
+SAMPLE_RATE_PARAM = 'state.instrumentation_sample_rate'
+DEFAULT_SAMPLE_RATE = 0.01
+
+# {dbname: {key: {calls, records, queries, total_time, max_time}}}
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def get_sample_rate(env):
+    """Returns the configured sampling rate, between 0 and 1."""
+    value = env['ir.config_parameter'].sudo().get_param(
+        SAMPLE_RATE_PARAM, DEFAULT_SAMPLE_RATE
+    )
+    try:
+        return min(max(float(value), 0.0), 1.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def record_call(dbname, key, elapsed, queries, records):
+    """Adds one measured call to the aggregated statistics."""
+    with _stats_lock:
+        stat = _stats.setdefault(dbname, {}).setdefault(key, {
+            'calls': 0,
+            'records': 0,
+            'queries': 0,
+            'total_time': 0.0,
+            'max_time': 0.0,
+        })
+        stat['calls'] += 1
+        stat['records'] += records
+        stat['queries'] += queries
+        stat['total_time'] += elapsed
+        stat['max_time'] = max(stat['max_time'], elapsed)
+
+
+def get_stats(dbname):
+    """Returns a copy of the aggregated statistics of the database."""
+    with _stats_lock:
+        return {
+            key: dict(stat) for key, stat in _stats.get(dbname, {}).items()
+        }
+
+
+def reset_stats(dbname):
+    with _stats_lock:
+        _stats.pop(dbname, None)
+
+
+def instrumented(method):
+    """
+    Decorator measuring a model method on a sample of its calls.
+
+    The number of processed records is the size of the recordset, or of the
+    returned recordset for model-level methods such as create.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        rate = get_sample_rate(self.env)
+        if not rate or random.random() >= rate:
+            return method(self, *args, **kwargs)
+
+        cr = self.env.cr
+        queries = cr.sql_log_count
+        start = time.perf_counter()
+        result = None
+        try:
+            result = method(self, *args, **kwargs)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            query_count = cr.sql_log_count - queries
+            records = len(self)
+            if not records and isinstance(result, models.BaseModel):
+                records = len(result)
+            key = f"{self._name}:{method.__qualname__}"
+            record_call(cr.dbname, key, elapsed, query_count, records)
+            _logger.info(
+                "%s: %.2f ms, %s queries, %s record(s)",
+                key, elapsed * 1000, query_count, records
+            )
+    return wrapper
@@ -0,0 +1 @@
+from . import estate_property_export  # noqa: F401
@@ -0,0 +1,65 @@
+"""
+Estate Property Export Wizard
+============================
+
+This module defines the wizard used to export properties with their offers
+and tags. The file itself is produced by the streaming export controller
+(/state/export/properties), which loads the properties in fixed-size chunks
+so memory use stays flat whatever the number of records.
+
+Technical Details:
+- Model Name: estate.property.export
+- Transient: yes
+"""
+
+from odoo import fields, models  # type: ignore
+from odoo.tools.safe_eval import safe_eval  # type: ignore
+
+
+class EstatePropertyExport(models.TransientModel):
+    """
+    Estate Property Export Wizard
+
+    Key Fields:
+    - file_format: CSV or XLSX
+    - export_domain: Properties to export (selected records or all)
+    """
+
+    _name = "estate.property.export"
+    _description = "Real Estate Property Export"
+
+    file_format = fields.Selection(
+        selection=[
+            ('csv', 'CSV'),
+            ('xlsx', 'Excel (XLSX)'),
+        ],
+        required=True,
+        default='csv',
+        help="Format of the exported file"
+    )
+    export_domain = fields.Char(
+        default=lambda self: self._default_export_domain(),
+        help="Domain of the exported properties"
+    )
+
+    def _default_export_domain(self):
+        context = self.env.context
+        if context.get('active_model') == 'estate.property':
+            if context.get('active_ids'):
+                return repr([('id', 'in', context['active_ids'])])
+            if context.get('active_domain'):
+                return repr(context['active_domain'])
+        return '[]'
+
+    def _get_export_domain(self):
+        self.ensure_one()
+        return safe_eval(self.export_domain or '[]')
+
+    def action_export(self):
+        """Downloads the export through the streaming controller."""
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/state/export/properties/{self.id}',
+            'target': 'self',
+        }